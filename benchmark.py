@@ -0,0 +1,339 @@
+"""Benchmark polling, writes and detection against the simulated device.
+
+Runs the integration's coordinator and config flow detection against
+simulator.py and reports, per firmware, transport and I/O mode:
+
+- poll wall time, Modbus requests, bytes on the wire and executor-thread
+  time for the first (full) poll and for steady-state polls
+- latency from a write command to the optimistic and the confirmed state
+- duration and request count of config flow device detection
+
+Results are written as JSON. With --baseline, any metric that got worse
+than the baseline (beyond --tolerance for timings) fails the run, so
+polling cost regressions can be caught in CI.
+
+Requires Home Assistant and pymodbus (a Home Assistant development
+environment).
+
+Usage:
+    python benchmark.py [--firmware 1 2] [--io-mode executor asyncio]
+                        [--transport tcp rtu_over_tcp]
+                        [--polls N] [--latency SECONDS] [--persistent]
+                        [--output FILE] [--baseline FILE] [--tolerance RATIO]
+
+Example:
+    python benchmark.py --output baseline.json
+    python benchmark.py --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pymodbus
+
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+
+from custom_components.parmair.config_flow import validate_connection
+from custom_components.parmair.const import (
+    CONF_IO_MODE,
+    CONF_PERSISTENT_CONNECTION,
+    CONF_SCAN_INTERVAL,
+    CONF_SLAVE_ID,
+    CONF_SOFTWARE_VERSION,
+    CONF_TRANSPORT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLAVE_ID,
+    IO_MODE_ASYNCIO,
+    IO_MODE_EXECUTOR,
+    MODE_BOOST,
+    MODE_HOME,
+    REG_CONTROL_STATE,
+    SOFTWARE_VERSION_1,
+    SOFTWARE_VERSION_2,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_TCP,
+)
+from custom_components.parmair.coordinator import ParmairCoordinator
+from simulator import FaultProfile, ParmairSimulator
+
+SOFTWARE_VERSIONS = {"1": SOFTWARE_VERSION_1, "2": SOFTWARE_VERSION_2}
+
+# Metrics that must never grow; everything else is a timing
+COUNT_METRICS = ("requests", "bytes")
+
+
+class TimingExecutor(ThreadPoolExecutor):
+    """Thread pool that adds up how long its workers are busy."""
+
+    def __init__(self) -> None:
+        """Initialize the executor."""
+        super().__init__(thread_name_prefix="benchmark")
+        self._lock = threading.Lock()
+        self.busy = 0.0
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Run a job, timing it."""
+
+        def timed():
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.busy += time.perf_counter() - start
+
+        return super().submit(timed)
+
+
+class EntryStore:
+    """Stand-in for the config entry registry; the coordinator only saves pacing to it."""
+
+    def async_update_entry(self, entry: SimpleNamespace, *, data: dict[str, Any]) -> bool:
+        """Replace the entry data."""
+        entry.data = data
+        return True
+
+
+class Meter:
+    """Measure one operation against the simulator."""
+
+    def __init__(self, simulator: ParmairSimulator, executor: TimingExecutor) -> None:
+        """Initialize the meter."""
+        self._simulator = simulator
+        self._executor = executor
+
+    def __enter__(self) -> Meter:
+        """Start measuring."""
+        stats = self._simulator.stats
+        self._requests = stats.requests
+        self._bytes = stats.bytes_sent + stats.bytes_received
+        self._busy = self._executor.busy
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop measuring."""
+        stats = self._simulator.stats
+        self.wall_ms = (time.perf_counter() - self._start) * 1000
+        self.requests = stats.requests - self._requests
+        self.bytes = stats.bytes_sent + stats.bytes_received - self._bytes
+        self.executor_ms = (self._executor.busy - self._busy) * 1000
+
+
+def _free_port() -> int:
+    """Return a TCP port nobody is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _async_run_scenario(
+    hass: HomeAssistant,
+    executor: TimingExecutor,
+    firmware: str,
+    transport: str,
+    io_mode: str,
+    args: argparse.Namespace,
+) -> dict[str, float]:
+    """Benchmark one firmware, transport and I/O mode, returning its metrics."""
+    port = _free_port()
+    simulator = ParmairSimulator(
+        firmware=firmware,
+        port=port,
+        faults=FaultProfile(latency=args.latency, jitter=args.jitter, seed=0),
+        rtu=transport == TRANSPORT_RTU_OVER_TCP,
+    )
+    await simulator.async_start()
+    metrics: dict[str, float] = {}
+    data = {
+        CONF_HOST: simulator.host,
+        CONF_PORT: port,
+        CONF_SLAVE_ID: DEFAULT_SLAVE_ID,
+        CONF_NAME: "Benchmark",
+        CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+        CONF_SOFTWARE_VERSION: SOFTWARE_VERSIONS[firmware],
+        CONF_TRANSPORT: transport,
+        CONF_IO_MODE: io_mode,
+        CONF_PERSISTENT_CONNECTION: args.persistent,
+    }
+
+    try:
+        # Config flow detection
+        with Meter(simulator, executor) as meter:
+            result = await validate_connection(hass, dict(data))
+        if not result or result[CONF_SOFTWARE_VERSION] != SOFTWARE_VERSIONS[firmware]:
+            raise RuntimeError(f"Detection failed for firmware {firmware}: {result}")
+        metrics["detection.wall_ms"] = meter.wall_ms
+        metrics["detection.requests"] = meter.requests
+
+        entry = SimpleNamespace(
+            entry_id=f"benchmark_{firmware}_{transport}_{io_mode}", data=data
+        )
+        coordinator = ParmairCoordinator(hass, entry)
+
+        # First poll reads static and every tier
+        with Meter(simulator, executor) as meter:
+            await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            raise RuntimeError(f"First poll failed: {coordinator.last_exception}")
+        metrics["poll_initial.wall_ms"] = meter.wall_ms
+        metrics["poll_initial.requests"] = meter.requests
+        metrics["poll_initial.bytes"] = meter.bytes
+        metrics["poll_initial.executor_ms"] = meter.executor_ms
+
+        # Steady-state polls
+        polls = []
+        for _ in range(args.polls):
+            with Meter(simulator, executor) as meter:
+                await coordinator.async_refresh()
+            polls.append(meter)
+        metrics["poll.wall_ms"] = statistics.median(poll.wall_ms for poll in polls)
+        metrics["poll.wall_ms_max"] = max(poll.wall_ms for poll in polls)
+        metrics["poll.requests"] = max(poll.requests for poll in polls)
+        metrics["poll.bytes"] = max(poll.bytes for poll in polls)
+        metrics["poll.executor_ms"] = statistics.median(poll.executor_ms for poll in polls)
+
+        # Write command to optimistic and confirmed state
+        optimistic: list[float] = []
+        confirmed: list[float] = []
+        for mode in (MODE_BOOST, MODE_HOME) * 2:
+            published: list[float] = []
+            start = time.perf_counter()
+
+            def _on_update(mode: int = mode) -> None:
+                if not published and coordinator.data.get(REG_CONTROL_STATE) == mode:
+                    published.append(time.perf_counter())
+
+            remove = coordinator.async_add_listener(_on_update)
+            try:
+                with Meter(simulator, executor) as meter:
+                    if not await coordinator.async_write_register(REG_CONTROL_STATE, mode):
+                        raise RuntimeError("Write failed")
+            finally:
+                remove()
+            optimistic.append(((published[0] if published else time.perf_counter()) - start) * 1000)
+            confirmed.append(meter.wall_ms)
+        metrics["write.optimistic_ms"] = statistics.median(optimistic)
+        metrics["write.confirmed_ms"] = statistics.median(confirmed)
+        metrics["write.requests"] = meter.requests
+
+        await coordinator.async_shutdown()
+    finally:
+        await simulator.async_stop()
+
+    return metrics
+
+
+def _check_regressions(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return a description of every metric worse than the baseline."""
+    failures = []
+    for scenario, metrics in baseline["scenarios"].items():
+        current = results["scenarios"].get(scenario)
+        if current is None:
+            continue
+        for name, expected in metrics.items():
+            if name not in current:
+                continue
+            limit = expected if name.endswith(COUNT_METRICS) else expected * (1 + tolerance)
+            if current[name] > limit:
+                failures.append(
+                    f"{scenario} {name}: {current[name]:.1f} > {limit:.1f} (baseline {expected:.1f})"
+                )
+    return failures
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    """Run all scenarios."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+        hass.config_entries = EntryStore()
+        executor = TimingExecutor()
+        hass.loop.set_default_executor(executor)
+
+        results: dict[str, Any] = {
+            "pymodbus": pymodbus.__version__,
+            "latency": args.latency,
+            "persistent": args.persistent,
+            "scenarios": {},
+        }
+        for firmware in args.firmware:
+            for transport in args.transport:
+                for io_mode in args.io_mode:
+                    # Plain Modbus TCP keeps the scenario names of older baselines
+                    scenario = (
+                        f"v{firmware}-{io_mode}"
+                        if transport == TRANSPORT_TCP
+                        else f"v{firmware}-{transport}-{io_mode}"
+                    )
+                    print(f"Running {scenario}...", file=sys.stderr)
+                    results["scenarios"][scenario] = await _async_run_scenario(
+                        hass, executor, firmware, transport, io_mode, args
+                    )
+        executor.shutdown(wait=False)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if failures := _check_regressions(results, baseline, args.tolerance):
+            print("Regressions against baseline:", file=sys.stderr)
+            for failure in failures:
+                print(f"  {failure}", file=sys.stderr)
+            return 1
+        print("No regressions against baseline", file=sys.stderr)
+    return 0
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Parmair integration")
+    parser.add_argument("--firmware", nargs="+", choices=("1", "2"), default=["1", "2"])
+    parser.add_argument(
+        "--io-mode",
+        nargs="+",
+        choices=(IO_MODE_EXECUTOR, IO_MODE_ASYNCIO),
+        default=[IO_MODE_EXECUTOR, IO_MODE_ASYNCIO],
+    )
+    parser.add_argument(
+        "--transport",
+        nargs="+",
+        choices=(TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP),
+        default=[TRANSPORT_TCP],
+    )
+    parser.add_argument("--polls", type=int, default=10, help="steady-state polls to time")
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated device latency")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency")
+    parser.add_argument("--persistent", action="store_true", help="keep the session open")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="fail if results are worse than this JSON file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed timing slowdown (0.25 = 25%%)"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_async_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
 from .coordinator import ParmairCoordinator
+from .services import async_setup_services, async_unload_services
+from .snapshot import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,17 +32,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     coordinator = ParmairCoordinator(hass, entry)
     
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as ex:
-        raise ConfigEntryNotReady(
-            f"Unable to connect to Parmair device at {entry.data.get('host')}"
-        ) from ex
+    if await coordinator.async_restore_snapshot():
+        # Entities start from the last known values; the first poll runs in
+        # the background so startup doesn't wait for the device
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as ex:
+            # Release the shared Modbus session before setup is retried
+            await coordinator.async_shutdown()
+            raise ConfigEntryNotReady(
+                f"Unable to connect to Parmair device at {entry.data.get('host')}"
+            ) from ex
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_services(hass)
     
     return True
 
@@ -48,6 +60,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: ParmairCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        async_unload_services(hass)
     
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored snapshot of a removed config entry."""
+    await SnapshotStore(hass, entry.entry_id).async_remove()
@@ -54,7 +54,8 @@ class ParmairButton(CoordinatorEntity[ParmairCoordinator], ButtonEntity):
         press_value: int,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        # Buttons have no state; only availability changes concern them
+        super().__init__(coordinator, frozenset())
         self._data_key = data_key
         self._press_value = press_value
         self._attr_name = name
@@ -72,7 +73,6 @@ class ParmairButton(CoordinatorEntity[ParmairCoordinator], ButtonEntity):
                 self._data_key,
             )
             await self.coordinator.async_write_register(self._data_key, self._press_value)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to press button %s: %s", self._attr_name, ex)
             raise
@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
 import voluptuous as vol
 import pymodbus
-from pymodbus.client import ModbusTcpClient
+from pymodbus.exceptions import ModbusException
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
@@ -16,316 +15,334 @@ from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 from homeassistant.loader import async_get_integration
 
-
-def _set_unit_id(client: ModbusTcpClient, unit_id: int) -> None:
-    """Set unit ID on the Modbus client for pymodbus 3.x."""
-    # Pymodbus 3.x uses 'slave' attribute
-    if hasattr(client, 'slave'):
-        client.slave = unit_id
-    # Fallback to other common attributes
-    elif hasattr(client, 'unit_id'):
-        client.unit_id = unit_id
-    elif hasattr(client, 'slave_id'):
-        client.slave_id = unit_id
-
-
 from .const import (
+    CONF_BAUDRATE,
     CONF_HEATER_TYPE,
+    CONF_IO_MODE,
+    CONF_PARITY,
+    CONF_PERSISTENT_CONNECTION,
     CONF_SCAN_INTERVAL,
+    CONF_SENTINEL_INTERVAL,
+    CONF_SERIAL_PORT,
     CONF_SLAVE_ID,
     CONF_SOFTWARE_VERSION,
+    CONF_STOPBITS,
+    CONF_TRANSPORT,
+    DEFAULT_BAUDRATE,
+    DEFAULT_IO_MODE,
+    DEFAULT_MAX_BLOCK_SIZE,
+    DEFAULT_MAX_READ_GAP,
     DEFAULT_NAME,
+    DEFAULT_PARITY,
+    DEFAULT_PERSISTENT_CONNECTION,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SENTINEL_INTERVAL,
     DEFAULT_SLAVE_ID,
+    DEFAULT_STOPBITS,
+    DEFAULT_TRANSPORT,
+    DETECTION_ATTEMPTS,
+    REQUEST_PRIORITY_POLL,
+    TRANSPORT_HANDOFF_TIMEOUT,
     DOMAIN,
     HEATER_TYPE_ELECTRIC,
     HEATER_TYPE_NONE,
-    HEATER_TYPE_UNKNOWN,
     HEATER_TYPE_WATER,
+    IO_MODE_ASYNCIO,
+    IO_MODE_EXECUTOR,
+    REG_HARDWARE_TYPE,
     REG_HEATER_TYPE,
     REG_POWER,
     REG_SOFTWARE_VERSION,
     SOFTWARE_VERSION_1,
     SOFTWARE_VERSION_2,
-    SOFTWARE_VERSION_UNKNOWN,
-    get_register_definition,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
+    RegisterDefinition,
+    get_registers_for_version,
+)
+from .planner import build_read_plan
+from .gateway import (
+    ModbusGateway,
+    UnitTransport,
+    async_acquire_gateway,
+    async_release_gateway,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Firmware candidates in detection order, with the plausible version range
+_FIRMWARE_CANDIDATES = (
+    ("2.xx", SOFTWARE_VERSION_2, (2.0, 2.99)),
+    ("1.xx", SOFTWARE_VERSION_1, (1.0, 1.99)),
+)
+
+# Serial speeds offered in setup
+BAUDRATES = [2400, 4800, 9600, 19200, 38400, 57600, 115200]
+
+_HEATER_NAMES = {
+    HEATER_TYPE_NONE: "None",
+    HEATER_TYPE_WATER: "Water",
+    HEATER_TYPE_ELECTRIC: "Electric",
+}
+
 
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
 
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+STEP_NETWORK_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): cv.string,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
+        vol.Optional(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): vol.In({
+            TRANSPORT_TCP: "Modbus TCP",
+            TRANSPORT_RTU_OVER_TCP: "Modbus RTU over TCP (serial bridge)",
+        }),
+        # Bus speed behind an RTU-over-TCP bridge, used for request pacing
+        vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
+        # Units behind a shared Modbus TCP gateway are told apart by unit ID
+        vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=247)
+        ),
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
             vol.Coerce(int), vol.Range(min=5, max=300)
         ),
+        # Seconds between sentinel checks of live state between polls, 0 = off
+        vol.Optional(CONF_SENTINEL_INTERVAL, default=DEFAULT_SENTINEL_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=60)
+        ),
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
+        vol.Optional(
+            CONF_PERSISTENT_CONNECTION, default=DEFAULT_PERSISTENT_CONNECTION
+        ): cv.boolean,
+        vol.Optional(CONF_IO_MODE, default=DEFAULT_IO_MODE): vol.In({
+            IO_MODE_EXECUTOR: "Executor thread (blocking client)",
+            IO_MODE_ASYNCIO: "Event loop (asyncio client)",
+        }),
     }
 )
 
+STEP_SERIAL_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERIAL_PORT): cv.string,
+        vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
+        vol.Optional(CONF_PARITY, default=DEFAULT_PARITY): vol.In({
+            "N": "None",
+            "E": "Even",
+            "O": "Odd",
+        }),
+        vol.Optional(CONF_STOPBITS, default=DEFAULT_STOPBITS): vol.In([1, 2]),
+        vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=247)
+        ),
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=5, max=300)
+        ),
+        # Seconds between sentinel checks of live state between polls, 0 = off
+        vol.Optional(CONF_SENTINEL_INTERVAL, default=DEFAULT_SENTINEL_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=60)
+        ),
+        vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
+        # A serial port has no session to flush, so keep it open by default
+        vol.Optional(CONF_PERSISTENT_CONNECTION, default=True): cv.boolean,
+        vol.Optional(CONF_IO_MODE, default=DEFAULT_IO_MODE): vol.In({
+            IO_MODE_EXECUTOR: "Executor thread (blocking client)",
+            IO_MODE_ASYNCIO: "Event loop (asyncio client)",
+        }),
+    }
+)
 
-async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect and detect device info."""
-    client = ModbusTcpClient(host=data[CONF_HOST], port=data[CONF_PORT])
-    
-    def _connect():
-        """Connect to the Modbus device."""
-        return client.connect()
-    
-    # Run the blocking connection in executor
-    connected = await hass.async_add_executor_job(_connect)
-    
-    if not connected:
-        client.close()
-        raise CannotConnect
-    
-    # Auto-detect software version and heater type with retry logic
-    def _detect_device_info():
-        """Detect software version and heater type from device with retries."""
-        detected_sw_version = SOFTWARE_VERSION_UNKNOWN
-        detected_heater_type = HEATER_TYPE_UNKNOWN
-        detected_firmware_registers = None  # Track which address set worked
-        detected_machine_type = None  # Track detected machine type value
-        
-        # Log pymodbus version for debugging
-        pymodbus_version = getattr(pymodbus, '__version__', 'unknown')
-        _LOGGER.info("Starting device auto-detection... (pymodbus version: %s)", pymodbus_version)
-        
-        # Longer initial delay after connection for device to stabilize during setup
-        time.sleep(1.0)
-        
-        # Two-register consensus detection for robust firmware identification
-        # Each firmware version has unique SOFTWARE_VERSION and VENT_MACHINE addresses
-        # Both registers must be readable for positive identification
-        detection_sets = [
-            {
-                "firmware": "2.xx",
-                "sw_address": 1015,  # SOFTWARE_VERSION for firmware 2.xx
-                "vm_address": 1125,  # VENT_MACHINE for firmware 2.xx
-                "sw_range": (2.0, 2.99),
-            },
-            {
-                "firmware": "1.xx",
-                "sw_address": 1018,  # SOFTWARE_VERSION for firmware 1.xx
-                "vm_address": 1244,  # VENT_MACHINE for firmware 1.xx
-                "sw_range": (1.0, 1.99),
-            },
-        ]
-        
-        def _read_register(address: int) -> int | None:
-            """Read a single register with pymodbus 3.x."""
-            try:
-                # Set the unit ID on the client
-                _set_unit_id(client, data[CONF_SLAVE_ID])
-                
-                # Read using pymodbus 3.x API
-                result = client.read_holding_registers(address, count=1)
-                
-                # Check if read was successful
-                if result and not (hasattr(result, "isError") and result.isError()):
-                    # Extract register value
-                    if hasattr(result, "registers"):
-                        return result.registers[0]
-                    elif isinstance(result, (list, tuple)):
-                        return result[0]
-                    else:
-                        return result
-            except Exception as ex:
-                _LOGGER.debug("Failed to read register at address %d: %s", address, ex)
-            return None
-        
-        # Warm-up: Read universal register (1001 - power) repeatedly until device responds
-        # This "wakes up" the device and ensures it's ready for version detection
-        _LOGGER.debug("Warming up connection by reading power register (1001)...")
-        warmup_success = False
-        for attempt in range(5):  # Try up to 5 times
-            warmup_value = _read_register(1001)
-            if warmup_value is not None:
-                _LOGGER.debug("Warm-up successful on attempt %d, device is responding", attempt + 1)
-                warmup_success = True
-                break
-            _LOGGER.debug("Warm-up attempt %d failed, waiting 500ms...", attempt + 1)
-            time.sleep(0.5)
-        
-        if not warmup_success:
-            _LOGGER.warning("Device warm-up failed after 5 attempts, detection may fail")
-        
-        # Try each firmware detection set
-        for detection_set in detection_sets:
-            firmware = detection_set["firmware"]
-            sw_address = detection_set["sw_address"]
-            vm_address = detection_set["vm_address"]
-            sw_min, sw_max = detection_set["sw_range"]
-            
-            _LOGGER.debug(
-                "Trying two-register consensus detection for firmware %s (SW:%d, VM:%d)",
-                firmware, sw_address, vm_address
-            )
-            
-            # Read both registers with delay between reads
-            raw_sw = _read_register(sw_address)
-            time.sleep(0.2)  # Delay between register reads during detection
-            raw_vm = _read_register(vm_address)
-            time.sleep(0.1)  # Small delay before validation
-            
-            # Validate both registers
-            sw_valid = False
-            vm_readable = False
-            
-            if raw_sw is not None and 0 < raw_sw < 10000:
-                sw_version = raw_sw * 0.01
-                if sw_min <= sw_version <= sw_max:
-                    sw_valid = True
-                    _LOGGER.debug(
-                        "Address %d returned valid version %.2f for firmware %s",
-                        sw_address, sw_version, firmware
-                    )
-                else:
+
+async def _async_read_definitions(
+    gateway: ModbusGateway,
+    transport: UnitTransport,
+    definitions: list[RegisterDefinition],
+    attempts: int = 1,
+) -> dict[int, int]:
+    """Read registers in as few block reads as possible.
+
+    Returns raw values by address; addresses that could not be read are
+    missing. Failed requests are retried up to attempts times, draining late
+    responses in between, and a block that still fails is read register by
+    register. Requests take their turn with other units on the gateway.
+    """
+    values: dict[int, int] = {}
+
+    async def _async_read(address: int, count: int) -> list[int] | None:
+        for attempt in range(attempts):
+            async with gateway.scheduler.async_slot(REQUEST_PRIORITY_POLL, transport.unit_id):
+                try:
+                    if not await transport.async_connect():
+                        return None
+                    result = await transport.async_read_holding_registers(address, count)
+                except ModbusException as ex:
                     _LOGGER.debug(
-                        "Address %d version %.2f outside expected range %.2f-%.2f",
-                        sw_address, sw_version, sw_min, sw_max
+                        "Read of %d register(s) at %d failed (attempt %d): %s",
+                        count, address, attempt + 1, ex,
                     )
-            else:
-                _LOGGER.debug("Address %d returned invalid or no data", sw_address)
-            
-            if raw_vm is not None:
-                vm_readable = True
-                _LOGGER.debug(
-                    "Address %d returned machine type value %d",
-                    vm_address, raw_vm
-                )
-            else:
-                _LOGGER.debug(
-                    "Address %d returned no data",
-                    vm_address
-                )
-            
-            # Both registers must be readable for consensus
-            if sw_valid and vm_readable:
-                if firmware == "2.xx":
-                    detected_sw_version = SOFTWARE_VERSION_2
-                else:
-                    detected_sw_version = SOFTWARE_VERSION_1
-                
-                detected_firmware_registers = firmware
-                detected_machine_type = raw_vm  # Store detected machine type
-                
-                _LOGGER.info(
-                    "Firmware %s confirmed by two-register consensus: "
-                    "SW version %.2f (addr %d) + Machine type %d (addr %d)",
-                    firmware, sw_version, sw_address, raw_vm, vm_address
-                )
-                break  # Success, exit detection loop
-            else:
-                _LOGGER.debug(
-                    "Firmware %s consensus failed (SW valid: %s, VM readable: %s)",
-                    firmware, sw_valid, vm_readable
-                )
-        
-        # If software version was not detected, return None to trigger manual selection
-        if detected_sw_version == SOFTWARE_VERSION_UNKNOWN:
-            _LOGGER.warning(
-                "Could not auto-detect software version via two-register consensus"
+                    if not await transport.async_drain():
+                        await transport.async_close(force=True)
+                    continue
+            if (
+                result is None
+                or (hasattr(result, "isError") and result.isError())
+                or len(getattr(result, "registers", ())) < count
+            ):
+                # The device answered, so retrying the same request won't help
+                _LOGGER.debug("Address %d returned an error response: %s", address, result)
+                return None
+            return result.registers
+        return None
+
+    plan = build_read_plan(definitions, DEFAULT_MAX_READ_GAP, DEFAULT_MAX_BLOCK_SIZE)
+    for block in plan:
+        if (registers := await _async_read(block.address, block.count)) is not None:
+            for definition, raw in block.split(registers):
+                values[definition.address] = raw
+            continue
+        if block.count == 1:
+            continue
+        for address, _definitions in block.by_address():
+            if (registers := await _async_read(address, 1)) is not None:
+                values[address] = registers[0]
+    return values
+
+
+async def _async_detect_device_info(
+    gateway: ModbusGateway, transport: UnitTransport
+) -> tuple[str, int] | None:
+    """Detect software version and heater type over an open session.
+
+    Both firmware candidates' version registers are read together first; the
+    detected firmware's machine type, heater type and power registers then
+    follow in one more pass, which also verifies communication. Returns None
+    if the firmware could not be identified.
+    """
+    # Log pymodbus version for debugging
+    pymodbus_version = getattr(pymodbus, '__version__', 'unknown')
+    _LOGGER.info("Starting device auto-detection... (pymodbus version: %s)", pymodbus_version)
+
+    candidates = [
+        (firmware, software_version, sw_range, get_registers_for_version(software_version))
+        for firmware, software_version, sw_range in _FIRMWARE_CANDIDATES
+    ]
+
+    # The first response shows the device is ready, so it is retried rather
+    # than preceded by a fixed warm-up delay
+    versions = await _async_read_definitions(
+        gateway,
+        transport,
+        [registers[REG_SOFTWARE_VERSION] for _, _, _, registers in candidates],
+        attempts=DETECTION_ATTEMPTS,
+    )
+    if not versions:
+        # The session is open, so let the user pick the firmware manually
+        _LOGGER.warning("Device did not answer version register reads")
+        return None
+
+    # Two-register consensus: the version register must hold a plausible
+    # version and the machine type register of the same firmware must be
+    # readable
+    for firmware, software_version, (sw_min, sw_max), registers in candidates:
+        sw_address = registers[REG_SOFTWARE_VERSION].address
+        raw_sw = versions.get(sw_address)
+        if raw_sw is None or not 0 < raw_sw < 10000:
+            _LOGGER.debug("Address %d returned invalid or no data", sw_address)
+            continue
+        sw_version = raw_sw * 0.01
+        if not sw_min <= sw_version <= sw_max:
+            _LOGGER.debug(
+                "Address %d version %.2f outside expected range %.2f-%.2f",
+                sw_address, sw_version, sw_min, sw_max
+            )
+            continue
+
+        hardware_type = registers[REG_HARDWARE_TYPE]
+        heater_type = registers[REG_HEATER_TYPE]
+        power = registers[REG_POWER]
+        details = await _async_read_definitions(
+            gateway, transport, [hardware_type, heater_type, power]
+        )
+
+        raw_vm = details.get(hardware_type.address)
+        if raw_vm is None:
+            _LOGGER.debug(
+                "Firmware %s consensus failed: machine type address %d returned no data",
+                firmware, hardware_type.address
+            )
+            continue
+
+        _LOGGER.info(
+            "Firmware %s confirmed by two-register consensus: "
+            "SW version %.2f (addr %d) + Machine type %d (addr %d)",
+            firmware, sw_version, sw_address, raw_vm, hardware_type.address
+        )
+
+        if power.address not in details:
+            _LOGGER.warning("Test read of power register %d failed", power.address)
+            raise CannotConnect
+
+        # Validate heater type (0=Water, 1=Electric, 2=None)
+        raw_heater = details.get(heater_type.address)
+        if raw_heater in _HEATER_NAMES:
+            detected_heater_type = int(raw_heater)
+            _LOGGER.info(
+                "Auto-detected heater type: %s (%s) from address %d (firmware %s)",
+                detected_heater_type,
+                _HEATER_NAMES[detected_heater_type],
+                heater_type.address,
+                firmware,
             )
-            # Return None to indicate detection failed - user will be asked to select manually
-            return None
-        
-        # Now detect heater type using the correct address for detected firmware
-        heater_addresses = []
-        if detected_firmware_registers == "2.xx":
-            # Firmware 2.xx: heater type at address 1127
-            heater_addresses = [(1127, "2.xx")]
         else:
-            # Firmware 1.xx: heater type at address 1240
-            heater_addresses = [(1240, "1.xx")]
-        
-        # Try to read heater type from the correct address
-        for heater_address, fw_label in heater_addresses:
-            _LOGGER.debug("Trying heater type detection with address %d (firmware %s)", heater_address, fw_label)
-            
-            raw_heater = _read_register(heater_address)
-            
-            # Validate heater type (0=Water, 1=Electric, 2=None)
-            if raw_heater is not None and raw_heater in [0, 1, 2]:
-                detected_heater_type = int(raw_heater)
-                
-                heater_names = {
-                    HEATER_TYPE_NONE: "None",
-                    HEATER_TYPE_WATER: "Water",
-                    HEATER_TYPE_ELECTRIC: "Electric",
-                }
-                
-                _LOGGER.info(
-                    "Auto-detected heater type: %s (%s) from address %d (firmware %s)",
-                    detected_heater_type,
-                    heater_names.get(detected_heater_type, "Unknown"),
-                    heater_address,
-                    fw_label,
-                )
-                break  # Success, exit address loop
-            else:
-                _LOGGER.debug("Address %d returned invalid heater type: %s", heater_address, raw_heater)
-        
-        # Use defaults if detection failed
-        if detected_heater_type == HEATER_TYPE_UNKNOWN:
             detected_heater_type = HEATER_TYPE_NONE
             _LOGGER.warning(
-                "Heater type detection failed, defaulting to None (no heater)"
+                "Heater type detection failed (address %d returned %s), "
+                "defaulting to None (no heater)",
+                heater_type.address,
+                raw_heater,
             )
-        
-        # Log final detection summary
+
         _LOGGER.info(
             "=== Detection Complete === Firmware: %s | Machine Type: %s | Heater: %s",
-            detected_sw_version,
-            detected_machine_type if detected_machine_type is not None else "Unknown",
-            {HEATER_TYPE_NONE: "None", HEATER_TYPE_WATER: "Water", HEATER_TYPE_ELECTRIC: "Electric"}.get(
-                detected_heater_type, "Unknown"
-            ),
+            software_version,
+            raw_vm,
+            _HEATER_NAMES.get(detected_heater_type, "Unknown"),
         )
-        
-        return detected_sw_version, detected_heater_type
-    
-    detection_result = await hass.async_add_executor_job(_detect_device_info)
-    
+        return software_version, detected_heater_type
+
+    _LOGGER.warning("Could not auto-detect software version via two-register consensus")
+    return None
+
+
+async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the user input allows us to connect and detect device info.
+
+    Detection shares the session of other units behind the same endpoint.
+    On success the session is kept open for the new entry's coordinator.
+    """
+    gateway = async_acquire_gateway(hass, data)
+    transport = gateway.unit(data[CONF_SLAVE_ID])
+
+    try:
+        async with gateway.scheduler.async_slot(REQUEST_PRIORITY_POLL, transport.unit_id):
+            connected = await transport.async_connect()
+        if not connected:
+            raise CannotConnect
+        detection_result = await _async_detect_device_info(gateway, transport)
+    except Exception:
+        async_release_gateway(hass, gateway)
+        raise
+
     # If detection returned None, firmware version couldn't be determined
     if detection_result is None:
-        client.close()
+        async_release_gateway(hass, gateway)
         return None  # Signal to caller that manual selection is needed
-    
+
     detected_sw_version, detected_heater_type = detection_result
-    
-    # Verify communication by reading power register
-    power_register = get_register_definition(REG_POWER)
-    
-    # Try to read a register to verify communication
-    def _read_test():
-        """Test reading from the device with pymodbus 3.x."""
-        try:
-            # Set unit ID on client
-            _set_unit_id(client, data[CONF_SLAVE_ID])
-            
-            # Read using pymodbus 3.x API
-            result = client.read_holding_registers(power_register.address, count=1)
-            
-            return not result.isError() if hasattr(result, 'isError') else result is not None
-        except Exception as ex:
-            _LOGGER.debug("Test read failed: %s", ex)
-            return False
-    
-    try:
-        success = await hass.async_add_executor_job(_read_test)
-        if not success:
-            raise CannotConnect
-    finally:
-        client.close()
-    
+    async_release_gateway(hass, gateway, linger=TRANSPORT_HANDOFF_TIMEOUT)
+
     return {
         "title": data[CONF_NAME],
         CONF_SOFTWARE_VERSION: detected_sw_version,
@@ -347,7 +364,27 @@ class ParmairConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Handle the initial step: how the unit is connected."""
+        return self.async_show_menu(step_id="user", menu_options=["network", "serial"])
+
+    async def async_step_network(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a unit reached over the network (Modbus TCP or RTU over TCP)."""
+        return await self._async_step_connection("network", STEP_NETWORK_DATA_SCHEMA, user_input)
+
+    async def async_step_serial(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a unit on a local RS-485 serial port."""
+        if user_input is not None:
+            user_input[CONF_TRANSPORT] = TRANSPORT_SERIAL
+        return await self._async_step_connection("serial", STEP_SERIAL_DATA_SCHEMA, user_input)
+
+    async def _async_step_connection(
+        self, step_id: str, data_schema: vol.Schema, user_input: dict[str, Any] | None
+    ) -> FlowResult:
+        """Validate connection details, detect the device and create the entry."""
         errors: dict[str, str] = {}
         
         if self._integration_version is None:
@@ -358,13 +395,13 @@ class ParmairConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._integration_version = "unknown"
 
         if user_input is not None:
-            # Always use slave ID 0 (Parmair devices use unit 0)
-            user_input[CONF_SLAVE_ID] = DEFAULT_SLAVE_ID
-            
-            # Create unique ID based on host and slave ID
-            await self.async_set_unique_id(
-                f"{user_input[CONF_HOST]}_{user_input[CONF_SLAVE_ID]}"
+            # Create unique ID based on endpoint and slave ID
+            endpoint = (
+                user_input[CONF_SERIAL_PORT]
+                if user_input.get(CONF_TRANSPORT) == TRANSPORT_SERIAL
+                else user_input[CONF_HOST]
             )
+            await self.async_set_unique_id(f"{endpoint}_{user_input[CONF_SLAVE_ID]}")
             self._abort_if_unique_id_configured()
             
             try:
@@ -389,8 +426,8 @@ class ParmairConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
         
         return self.async_show_form(
-            step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
+            step_id=step_id,
+            data_schema=data_schema,
             errors=errors,
             description_placeholders={
                 "version": self._integration_version or "unknown",
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import combinations
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+from .planner import ReadBlock, build_read_plan
 
 DOMAIN = "parmair"
 
@@ -13,11 +18,102 @@ CONF_SCAN_INTERVAL = "scan_interval"
 CONF_SOFTWARE_VERSION = "software_version"
 CONF_HEATER_TYPE = "heater_type"
 
+# Services
+SERVICE_WRITE_REGISTERS = "write_registers"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_VALUES = "values"
+
 DEFAULT_NAME = "Parmair MAC"
 DEFAULT_SCAN_INTERVAL = 30  # seconds
 DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 0  # Parmair devices respond with unit ID 0
 
+# Block read planning
+CONF_MAX_READ_GAP = "max_read_gap"
+CONF_MAX_BLOCK_SIZE = "max_block_size"
+DEFAULT_MAX_READ_GAP = 5  # unused registers allowed inside one block read
+DEFAULT_MAX_BLOCK_SIZE = 32  # registers per request (Modbus allows up to 125)
+
+# Connection handling
+CONF_PERSISTENT_CONNECTION = "persistent_connection"
+DEFAULT_PERSISTENT_CONNECTION = False
+RECONNECT_BACKOFF_MIN = 2.0  # seconds before the first reconnect retry
+RECONNECT_BACKOFF_MAX = 120.0  # upper bound for exponential reconnect backoff
+
+# Sentinel fast lane: a few live-state registers checked between full polls
+CONF_SENTINEL_INTERVAL = "sentinel_interval"
+DEFAULT_SENTINEL_INTERVAL = 0  # seconds between sentinel checks, 0 = off
+SENTINEL_MAX_READ_GAP = 24  # lets v1.xx state, boost and power share one request
+
+# Config flow detection
+DETECTION_ATTEMPTS = 3  # first reads tried before the device counts as unresponsive
+TRANSPORT_HANDOFF_TIMEOUT = 60.0  # seconds a detection session waits for its entry
+
+# Modbus transport
+CONF_TRANSPORT = "transport"
+TRANSPORT_TCP = "tcp"  # Modbus TCP (MBAP framing)
+TRANSPORT_RTU_OVER_TCP = "rtu_over_tcp"  # RTU frames through a transparent serial bridge
+TRANSPORT_SERIAL = "serial"  # RTU on a local RS-485 adapter
+DEFAULT_TRANSPORT = TRANSPORT_TCP
+CONF_SERIAL_PORT = "serial_port"
+CONF_BAUDRATE = "baudrate"
+CONF_PARITY = "parity"
+CONF_STOPBITS = "stopbits"
+DEFAULT_BAUDRATE = 9600
+DEFAULT_PARITY = "N"
+DEFAULT_STOPBITS = 1
+RTU_CHARACTER_BITS = 11  # start, 8 data, parity (or second stop) and stop bit
+RTU_MIN_SILENT_INTERVAL = 0.00175  # 3.5 character gap, fixed above 19200 baud
+
+# Modbus I/O mode
+CONF_IO_MODE = "io_mode"
+IO_MODE_EXECUTOR = "executor"  # blocking pymodbus client in the executor
+IO_MODE_ASYNCIO = "asyncio"  # native pymodbus asyncio client on the event loop
+DEFAULT_IO_MODE = IO_MODE_EXECUTOR
+
+# Adaptive request pacing (seconds)
+CONF_REQUEST_DELAY = "request_delay"  # learned delay, persisted in the entry
+PACING_INITIAL_DELAY = 0.05  # start aggressive, back off if the device struggles
+PACING_MIN_DELAY = 0.01
+PACING_MAX_DELAY = 1.0
+PACING_DECREASE_STEP = 0.01  # additive speed-up after a clean run
+PACING_INCREASE_FACTOR = 2.0  # multiplicative back-off on errors
+PACING_SUCCESS_WINDOW = 20  # clean responses needed before speeding up
+PACING_SLOW_RESPONSE_FACTOR = 3.0  # latency spike that counts as congestion
+PACING_CONNECT_SETTLE_FACTOR = 1.5  # extra settle time after connecting
+PACING_PERSIST_THRESHOLD = 0.02  # delay change worth saving to the entry
+
+# Static registers cached in the entry, validated at startup by re-reading
+# the software version register only
+CONF_DEVICE_IDENTITY = "device_identity"
+
+# Samples kept for rolling poll, request and write timing metrics
+METRICS_WINDOW = 100
+# Recent requests kept for the diagnostics download
+REQUEST_LOG_SIZE = 256
+# Seconds of polled values kept in memory; samples are sized from the scan interval
+HISTORY_DURATION = 24 * 3600
+# Window summarised per register in the diagnostics download
+HISTORY_DIAGNOSTICS_WINDOW = 3600
+
+# Last known snapshot, published at startup so setup doesn't wait for the unit
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_INTERVAL = 300  # seconds between snapshot saves while polling
+SNAPSHOT_MAX_AGE = 24 * 3600  # older snapshots are ignored and setup polls first
+
+# Derived ventilation figures
+DERIVED_SMOOTHING_TIME = 300.0  # seconds, time constant of efficiency/imbalance averages
+DERIVED_TREND_TIME = 1800.0  # seconds, time constant of temperature trends
+DERIVED_MIN_TEMP_DIFFERENCE = 3.0  # indoor/outdoor difference needed for efficiency
+
+# Request priorities on the shared Modbus session (lower goes first)
+REQUEST_PRIORITY_WRITE = 0
+REQUEST_PRIORITY_POLL = 1
+
+# Quiet period before a debounced write is sent; later values replace
+# earlier ones so a slider drag becomes a single write
+WRITE_DEBOUNCE_DELAY = 0.75  # seconds
+
 # Software versions
 SOFTWARE_VERSION_1 = "1.x"
 SOFTWARE_VERSION_2 = "2.x"
@@ -44,6 +140,20 @@ HEATER_TYPE_NONE = 2
 HEATER_TYPE_UNKNOWN = -1
 
 
+# Polling tiers - how often a register is read
+POLL_TIER_FAST = "fast"  # every update (measurements and live state)
+POLL_TIER_NORMAL = "normal"  # user-facing settings that change occasionally
+POLL_TIER_SLOW = "slow"  # configuration that changes only when edited
+POLL_TIERS = (POLL_TIER_FAST, POLL_TIER_NORMAL, POLL_TIER_SLOW)
+
+# Minimum seconds between reads per tier
+POLL_TIER_INTERVALS: Dict[str, float] = {
+    POLL_TIER_FAST: 0,
+    POLL_TIER_NORMAL: 120,
+    POLL_TIER_SLOW: 600,
+}
+
+
 @dataclass(frozen=True)
 class RegisterDefinition:
     """Describe a Modbus holding register used by the integration."""
@@ -55,6 +165,7 @@ class RegisterDefinition:
     writable: bool = False
     optional: bool = False
     description: str | None = None
+    poll_tier: str = POLL_TIER_FAST
 
     @property
     def register_id(self) -> int:
@@ -115,7 +226,6 @@ REG_FILTER_INTERVAL = "filter_interval"
 
 # Additional sensor register keys
 REG_HEAT_RECOVERY_EFFICIENCY = "heat_recovery_efficiency"
-REG_OVERPRESSURE_TIMER = "overpressure_timer"
 REG_DEFROST_STATE = "defrost_state"
 REG_SUPPLY_FAN_SPEED = "supply_fan_speed"
 REG_EXHAUST_FAN_SPEED = "exhaust_fan_speed"
@@ -127,6 +237,75 @@ REG_FILTER_NEXT_DAY = "filter_next_day"
 REG_FILTER_NEXT_MONTH = "filter_next_month"
 REG_FILTER_NEXT_YEAR = "filter_next_year"
 
+# Registers polled less often than every update (all others are fast)
+REGISTER_POLL_TIERS: Dict[str, str] = {
+    REG_EXHAUST_TEMP_SETPOINT: POLL_TIER_NORMAL,
+    REG_SUPPLY_TEMP_SETPOINT: POLL_TIER_NORMAL,
+    REG_SUMMER_MODE: POLL_TIER_NORMAL,
+    REG_TIME_PROGRAM_ENABLE: POLL_TIER_NORMAL,
+    REG_HEATER_ENABLE: POLL_TIER_NORMAL,
+    REG_FILTER_STATE: POLL_TIER_NORMAL,
+    REG_HOME_SPEED: POLL_TIER_SLOW,
+    REG_AWAY_SPEED: POLL_TIER_SLOW,
+    REG_BOOST_SETTING: POLL_TIER_SLOW,
+    REG_BOOST_TIME_SETTING: POLL_TIER_SLOW,
+    REG_OVERPRESSURE_TIME_SETTING: POLL_TIER_SLOW,
+    REG_SUMMER_MODE_TEMP_LIMIT: POLL_TIER_SLOW,
+    REG_FILTER_INTERVAL: POLL_TIER_SLOW,
+    REG_FILTER_DAY: POLL_TIER_SLOW,
+    REG_FILTER_MONTH: POLL_TIER_SLOW,
+    REG_FILTER_YEAR: POLL_TIER_SLOW,
+    REG_FILTER_NEXT_DAY: POLL_TIER_SLOW,
+    REG_FILTER_NEXT_MONTH: POLL_TIER_SLOW,
+    REG_FILTER_NEXT_YEAR: POLL_TIER_SLOW,
+}
+
+# Registers whose value changes as a side effect of writing another register.
+# After a write the coordinator reads back the written register plus these.
+WRITE_DEPENDENTS: Dict[str, tuple[str, ...]] = {
+    REG_POWER: (REG_CONTROL_STATE, REG_ACTUAL_SPEED),
+    REG_CONTROL_STATE: (
+        REG_HOME_STATE,
+        REG_BOOST_STATE,
+        REG_BOOST_TIMER,
+        REG_OVERPRESSURE_STATE,
+        REG_OVERPRESSURE_TIMER,
+        REG_ACTUAL_SPEED,
+    ),
+    REG_SPEED_CONTROL: (REG_ACTUAL_SPEED,),
+    REG_HOME_SPEED: (REG_ACTUAL_SPEED,),
+    REG_AWAY_SPEED: (REG_ACTUAL_SPEED,),
+    REG_BOOST_SETTING: (REG_ACTUAL_SPEED,),
+    REG_BOOST_TIMER: (REG_CONTROL_STATE, REG_BOOST_STATE),
+    REG_OVERPRESSURE_TIMER: (REG_CONTROL_STATE, REG_OVERPRESSURE_STATE),
+    REG_ACKNOWLEDGE_ALARMS: (REG_ALARM_COUNT, REG_SUM_ALARM, REG_ALARMS_STATE),
+    REG_FILTER_REPLACED: (
+        REG_FILTER_STATE,
+        REG_FILTER_DAY,
+        REG_FILTER_MONTH,
+        REG_FILTER_YEAR,
+        REG_FILTER_NEXT_DAY,
+        REG_FILTER_NEXT_MONTH,
+        REG_FILTER_NEXT_YEAR,
+    ),
+    REG_FILTER_INTERVAL: (
+        REG_FILTER_NEXT_DAY,
+        REG_FILTER_NEXT_MONTH,
+        REG_FILTER_NEXT_YEAR,
+    ),
+}
+
+
+def _with_poll_tiers(registers: Dict[str, RegisterDefinition]) -> Dict[str, RegisterDefinition]:
+    """Attach the polling tier from REGISTER_POLL_TIERS to each definition."""
+
+    return {
+        key: replace(definition, poll_tier=REGISTER_POLL_TIERS[key])
+        if key in REGISTER_POLL_TIERS
+        else definition
+        for key, definition in registers.items()
+    }
+
 
 def _build_registers_v1() -> Dict[str, RegisterDefinition]:
     """Build the complete register map for Parmair MAC devices with software version 1.xx.
@@ -134,7 +313,7 @@ def _build_registers_v1() -> Dict[str, RegisterDefinition]:
     This is the current register map from the CSV documentation.
     """
 
-    return {
+    return _with_poll_tiers({
         REG_HARDWARE_TYPE: RegisterDefinition(REG_HARDWARE_TYPE, 1244, "VENT_MACHINE"),
         REG_SOFTWARE_VERSION: RegisterDefinition(REG_SOFTWARE_VERSION, 1018, "MULTI_SW_VER", scale=0.01),
         REG_POWER: RegisterDefinition(REG_POWER, 1208, "POWER_BTN_FI", writable=True),
@@ -248,9 +427,6 @@ def _build_registers_v1() -> Dict[str, RegisterDefinition]:
         REG_HEAT_RECOVERY_EFFICIENCY: RegisterDefinition(
             REG_HEAT_RECOVERY_EFFICIENCY, 1190, "FG50_EA_M", scale=0.1
         ),
-        REG_OVERPRESSURE_TIMER: RegisterDefinition(
-            REG_OVERPRESSURE_TIMER, 1204, "OVERP_TIMER_FM"
-        ),
         REG_DEFROST_STATE: RegisterDefinition(
             REG_DEFROST_STATE, 1183, "DFRST_FI"
         ),
@@ -281,7 +457,7 @@ def _build_registers_v1() -> Dict[str, RegisterDefinition]:
         REG_FILTER_NEXT_YEAR: RegisterDefinition(
             REG_FILTER_NEXT_YEAR, 1091, "FILTERNEXT_YEAR", writable=True
         ),
-    }
+    })
 
 
 def _build_registers_v2() -> Dict[str, RegisterDefinition]:
@@ -294,7 +470,7 @@ def _build_registers_v2() -> Dict[str, RegisterDefinition]:
     control registers (POWER_BTN_FI, IV01_CONTROLSTATE_FO, etc.). Firmware 2.xx uses
     UNIT_CONTROL_FO and USERSTATECONTROL_FO instead.
     """
-    return {
+    return _with_poll_tiers({
         # System information - same register IDs as v1 but +1000 offset
         REG_HARDWARE_TYPE: RegisterDefinition(REG_HARDWARE_TYPE, 1125, "VENT_MACHINE"),
         REG_SOFTWARE_VERSION: RegisterDefinition(REG_SOFTWARE_VERSION, 1015, "MULTI_SW_VER", scale=0.01),
@@ -361,7 +537,6 @@ def _build_registers_v2() -> Dict[str, RegisterDefinition]:
         
         # Additional sensor registers
         REG_HEAT_RECOVERY_EFFICIENCY: RegisterDefinition(REG_HEAT_RECOVERY_EFFICIENCY, 1183, "FG50_EA_M", scale=0.1),
-        REG_OVERPRESSURE_TIMER: RegisterDefinition(REG_OVERPRESSURE_TIMER, 1201, "OVERP_TIMER_FM"),
         REG_DEFROST_STATE: RegisterDefinition(REG_DEFROST_STATE, 1182, "DFRST_FI"),
         REG_SUPPLY_FAN_SPEED: RegisterDefinition(REG_SUPPLY_FAN_SPEED, 1040, "TF10_Y", scale=0.1),
         REG_EXHAUST_FAN_SPEED: RegisterDefinition(REG_EXHAUST_FAN_SPEED, 1042, "PF30_Y", scale=0.1),
@@ -372,28 +547,9 @@ def _build_registers_v2() -> Dict[str, RegisterDefinition]:
         REG_FILTER_NEXT_DAY: RegisterDefinition(REG_FILTER_NEXT_DAY, 1196, "FILTERNEXT_DAY", writable=True),
         REG_FILTER_NEXT_MONTH: RegisterDefinition(REG_FILTER_NEXT_MONTH, 1197, "FILTERNEXT_MONTH", writable=True),
         REG_FILTER_NEXT_YEAR: RegisterDefinition(REG_FILTER_NEXT_YEAR, 1198, "FILTERNEXT_YEAR", writable=True),
-    }
+    })
 
 
-def get_registers_for_version(software_version: str) -> Dict[str, RegisterDefinition]:
-    """Get the appropriate register map based on software version.
-    
-    Args:
-        software_version: Software version string (e.g., "1.83", "2.10")
-    
-    Returns:
-        Dictionary mapping register keys to RegisterDefinition objects
-    """
-    if software_version.startswith("2."):
-        return _build_registers_v2()
-    else:
-        # Default to v1 for 1.xx or unknown versions
-        return _build_registers_v1()
-
-
-# Build the default register map (v1)
-REGISTERS = _build_registers_v1()
-
 # Static registers (read once at startup - values don't change during operation)
 STATIC_REGISTER_KEYS = (
     REG_SOFTWARE_VERSION,  # Software version never changes
@@ -429,7 +585,6 @@ POLLING_REGISTER_KEYS = (
     REG_SUM_ALARM,
     REG_ALARMS_STATE,
     REG_HEAT_RECOVERY_EFFICIENCY,
-    REG_OVERPRESSURE_TIMER,
     REG_DEFROST_STATE,
     REG_SUPPLY_FAN_SPEED,
     REG_EXHAUST_FAN_SPEED,
@@ -450,8 +605,194 @@ POLLING_REGISTER_KEYS = (
     REG_FILTER_INTERVAL,
 )
 
+# Registers of optional sensor modules; probed when the device identity is
+# read and left out of polling and the entity set when the module is absent
+OPTIONAL_MODULE_REGISTER_KEYS = (
+    REG_HUMIDITY,
+    REG_HUMIDITY_24H_AVG,
+    REG_CO2_EXHAUST,
+)
+# Raw words an absent module reports (0, or -1 as an unsigned word). A fitted
+# sensor also reads -1 while calibrating, so a module only counts as absent
+# after MODULE_PROBE_READS such reads MODULE_PROBE_INTERVAL seconds apart
+ABSENT_MODULE_VALUES = (0, 0xFFFF)
+MODULE_PROBE_READS = 3
+MODULE_PROBE_INTERVAL = 2.0  # seconds
+
+# Registers whose change means the unit changed state on its own (panel,
+# time program, alarms); polled by the sentinel fast lane
+SENTINEL_REGISTER_KEYS = (
+    REG_CONTROL_STATE,
+    REG_POWER,
+    REG_ALARM_COUNT,
+    REG_SUM_ALARM,
+    REG_BOOST_STATE,
+)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledRegisterMap:
+    """Immutable register map for one firmware generation, built once per process."""
+
+    software_version: str
+    registers: Mapping[str, RegisterDefinition]
+    keys_by_address: Mapping[int, tuple[str, ...]]  # aliased keys share an address
+    addresses: tuple[int, ...]  # sorted unique addresses, for range planning
+    static_registers: tuple[RegisterDefinition, ...]
+    poll_registers: tuple[RegisterDefinition, ...]
+    polled_keys: frozenset[str]
+    # Plans at the default block settings for every combination of tiers
+    poll_plans: Mapping[frozenset[str], tuple[ReadBlock, ...]]
+    # Block reads covering the sentinel registers
+    sentinel_plan: tuple[ReadBlock, ...]
+
+    def keys_at(self, address: int) -> tuple[str, ...]:
+        """Return every key mapped to an address."""
+
+        return self.keys_by_address.get(address, ())
+
+    def poll_plan(
+        self,
+        tiers: frozenset[str],
+        max_gap: int = DEFAULT_MAX_READ_GAP,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+        exclude: frozenset[str] = frozenset(),
+    ) -> tuple[ReadBlock, ...]:
+        """Return the block reads covering the polled registers of some tiers.
+
+        Keys in exclude (e.g. sensor modules the unit doesn't have) are left
+        out of the plan.
+        """
+
+        if (
+            not exclude
+            and max_gap == DEFAULT_MAX_READ_GAP
+            and max_block_size == DEFAULT_MAX_BLOCK_SIZE
+        ):
+            return self.poll_plans[tiers]
+        return _build_poll_plan(
+            self.software_version, tiers, max_gap, max_block_size, exclude
+        )
+
+
+def _normalize_software_version(software_version: str) -> str:
+    """Map a detected or stored software version onto its register map."""
+
+    if software_version.startswith("2."):
+        return SOFTWARE_VERSION_2
+    # Default to v1 for 1.xx or unknown versions
+    return SOFTWARE_VERSION_1
+
+
+@lru_cache(maxsize=None)
+def _compile_registers(software_version: str) -> CompiledRegisterMap:
+    """Build the compiled register map for a normalized software version."""
+
+    if software_version == SOFTWARE_VERSION_2:
+        registers = _build_registers_v2()
+    else:
+        registers = _build_registers_v1()
+
+    keys_by_address: Dict[int, list[str]] = {}
+    for key, definition in registers.items():
+        keys_by_address.setdefault(definition.address, []).append(key)
+
+    # Polled keys aliasing one address are read together on the fastest tier
+    # among them, so one read serves them all and they never disagree
+    polled = set(POLLING_REGISTER_KEYS)
+    for keys in keys_by_address.values():
+        aliases = [key for key in keys if key in polled]
+        if len(aliases) > 1:
+            tier = min(
+                (registers[key].poll_tier for key in aliases), key=POLL_TIERS.index
+            )
+            for key in aliases:
+                registers[key] = replace(registers[key], poll_tier=tier)
+
+    poll_registers = tuple(
+        registers[key] for key in POLLING_REGISTER_KEYS if key in registers
+    )
+    poll_plans = {
+        frozenset(tiers): build_read_plan(
+            [definition for definition in poll_registers if definition.poll_tier in tiers],
+            max_gap=DEFAULT_MAX_READ_GAP,
+            max_block_size=DEFAULT_MAX_BLOCK_SIZE,
+        )
+        for size in range(len(POLL_TIERS) + 1)
+        for tiers in combinations(POLL_TIERS, size)
+    }
+
+    return CompiledRegisterMap(
+        software_version=software_version,
+        registers=MappingProxyType(registers),
+        keys_by_address=MappingProxyType(
+            {address: tuple(keys) for address, keys in keys_by_address.items()}
+        ),
+        addresses=tuple(sorted(keys_by_address)),
+        static_registers=tuple(
+            registers[key] for key in STATIC_REGISTER_KEYS if key in registers
+        ),
+        poll_registers=poll_registers,
+        polled_keys=frozenset(definition.key for definition in poll_registers),
+        poll_plans=MappingProxyType(poll_plans),
+        sentinel_plan=build_read_plan(
+            [registers[key] for key in SENTINEL_REGISTER_KEYS if key in registers],
+            max_gap=SENTINEL_MAX_READ_GAP,
+            max_block_size=DEFAULT_MAX_BLOCK_SIZE,
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_poll_plan(
+    software_version: str,
+    tiers: frozenset[str],
+    max_gap: int,
+    max_block_size: int,
+    exclude: frozenset[str] = frozenset(),
+) -> tuple[ReadBlock, ...]:
+    """Plan the block reads for the polled registers of some tiers."""
+
+    return build_read_plan(
+        [
+            definition
+            for definition in _compile_registers(software_version).poll_registers
+            if definition.poll_tier in tiers and definition.key not in exclude
+        ],
+        max_gap=max_gap,
+        max_block_size=max_block_size,
+    )
+
+
+def get_compiled_registers(software_version: str) -> CompiledRegisterMap:
+    """Return the compiled register map for a software version.
+
+    Args:
+        software_version: Software version string (e.g., "1.83", "2.10")
+
+    Returns:
+        CompiledRegisterMap shared by every caller for that firmware generation
+    """
+    return _compile_registers(_normalize_software_version(software_version))
+
+
+def get_registers_for_version(software_version: str) -> Mapping[str, RegisterDefinition]:
+    """Get the appropriate register map based on software version.
+    
+    Args:
+        software_version: Software version string (e.g., "1.83", "2.10")
+    
+    Returns:
+        Read-only mapping of register keys to RegisterDefinition objects
+    """
+    return get_compiled_registers(software_version).registers
+
+
+# Default register map (v1)
+REGISTERS = get_registers_for_version(SOFTWARE_VERSION_1)
+
 
-def get_register_definition(key: str, registers: Dict[str, RegisterDefinition] | None = None) -> RegisterDefinition:
+def get_register_definition(key: str, registers: Mapping[str, RegisterDefinition] | None = None) -> RegisterDefinition:
     """Return the register definition for a given key.
     
     Args:
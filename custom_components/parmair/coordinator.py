@@ -1,52 +1,92 @@
 """DataUpdateCoordinator for Parmair integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-import threading
+import math
 import time
 from datetime import timedelta
-from typing import Any
+from typing import Any, Iterable
 
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.config_entries import ConfigEntry
 
 from .const import (
+    ABSENT_MODULE_VALUES,
+    CONF_DEVICE_IDENTITY,
     CONF_HEATER_TYPE,
+    CONF_IO_MODE,
+    CONF_MAX_BLOCK_SIZE,
+    CONF_MAX_READ_GAP,
+    CONF_PERSISTENT_CONNECTION,
+    CONF_REQUEST_DELAY,
     CONF_SCAN_INTERVAL,
+    CONF_SENTINEL_INTERVAL,
+    CONF_SERIAL_PORT,
     CONF_SLAVE_ID,
     CONF_SOFTWARE_VERSION,
+    DEFAULT_IO_MODE,
+    DEFAULT_MAX_BLOCK_SIZE,
+    DEFAULT_MAX_READ_GAP,
     DEFAULT_NAME,
+    DEFAULT_PERSISTENT_CONNECTION,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SENTINEL_INTERVAL,
     DOMAIN,
+    HISTORY_DIAGNOSTICS_WINDOW,
+    HISTORY_DURATION,
     HEATER_TYPE_UNKNOWN,
-    POLLING_REGISTER_KEYS,
+    METRICS_WINDOW,
+    MODULE_PROBE_INTERVAL,
+    MODULE_PROBE_READS,
+    OPTIONAL_MODULE_REGISTER_KEYS,
+    PACING_INITIAL_DELAY,
+    PACING_MAX_DELAY,
+    PACING_PERSIST_THRESHOLD,
+    POLL_TIER_FAST,
+    POLL_TIER_INTERVALS,
+    POLL_TIERS,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_BACKOFF_MIN,
     REGISTERS,
+    REQUEST_LOG_SIZE,
+    REQUEST_PRIORITY_POLL,
+    REQUEST_PRIORITY_WRITE,
+    REG_SOFTWARE_VERSION,
     SOFTWARE_VERSION_1,
     SOFTWARE_VERSION_UNKNOWN,
-    STATIC_REGISTER_KEYS,
+    WRITE_DEBOUNCE_DELAY,
+    WRITE_DEPENDENTS,
     RegisterDefinition,
+    get_compiled_registers,
     get_register_definition,
-    get_registers_for_version,
 )
+from .derived import VentilationMetrics
+from .gateway import async_acquire_gateway, async_release_gateway
+from .history import RegisterHistory
+from .metrics import ModbusMetrics, RequestLog
+from .pacing import AdaptivePacer
+from .planner import ReadBlock, build_read_plan, build_write_plan
+from .snapshot import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _set_unit_id(client: ModbusTcpClient, unit_id: int) -> None:
-    """Set unit ID on the Modbus client for pymodbus 3.x."""
-    # Pymodbus 3.x uses 'slave' attribute
-    if hasattr(client, 'slave'):
-        client.slave = unit_id
-    # Fallback to other common attributes
-    elif hasattr(client, 'unit_id'):
-        client.unit_id = unit_id
-    elif hasattr(client, 'slave_id'):
-        client.slave_id = unit_id
+# Function codes of the transport methods, for the request log
+_FUNCTION_CODES = {
+    "async_read_holding_registers": 3,
+    "async_write_register": 6,
+    "async_write_registers": 16,
+}
+
+
+def _is_transaction_mismatch(err: Exception) -> bool:
+    """Return True if pymodbus rejected a response for the wrong transaction ID."""
+    return isinstance(err, ModbusIOException) and "transaction id" in str(err)
 
 
 class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -55,36 +95,133 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.entry = entry
-        self.host = entry.data[CONF_HOST]
-        self.port = entry.data[CONF_PORT]
+        # Serial units are named after their serial port
+        self.host = entry.data.get(CONF_HOST) or entry.data[CONF_SERIAL_PORT]
+        self.port = entry.data.get(CONF_PORT)
         self.slave_id = entry.data[CONF_SLAVE_ID]
         self.software_version = entry.data.get(CONF_SOFTWARE_VERSION, SOFTWARE_VERSION_1)
         self.heater_type = entry.data.get(CONF_HEATER_TYPE, HEATER_TYPE_UNKNOWN)
         
         scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         
-        # Get version-specific register map
-        self._registers = get_registers_for_version(self.software_version)
+        # Get the shared, precompiled register map for this firmware
+        self._register_map = get_compiled_registers(self.software_version)
+        self._registers = self._register_map.registers
         
-        # Separate static and dynamic register lists
-        self._static_registers: list[RegisterDefinition] = [
-            self._registers[key]
-            for key in STATIC_REGISTER_KEYS
-            if key in self._registers
-        ]
+        # Static and dynamic register lists
+        self._static_registers = self._register_map.static_registers
         
-        self._poll_registers: list[RegisterDefinition] = [
-            self._registers[key]
-            for key in POLLING_REGISTER_KEYS
-            if key in self._registers
-        ]
+        # Optional sensor modules the unit lacks, as last probed; their
+        # registers are neither polled nor given entities
+        cached = entry.data.get(CONF_DEVICE_IDENTITY) or {}
+        self.absent_modules: frozenset[str] = frozenset(
+            cached.get("absent_modules", ())
+            if cached.get(CONF_SOFTWARE_VERSION) == self.software_version
+            else ()
+        )
+        self._poll_registers = self._present_poll_registers()
+        
+        # Polled registers are read in contiguous blocks, one plan per
+        # combination of polling tiers that are due together
+        self._max_read_gap = entry.data.get(CONF_MAX_READ_GAP, DEFAULT_MAX_READ_GAP)
+        self._max_block_size = entry.data.get(CONF_MAX_BLOCK_SIZE, DEFAULT_MAX_BLOCK_SIZE)
+        _LOGGER.debug(
+            "Polling %d registers with %d block reads (%d on fast tier only)",
+            len(self._poll_registers),
+            len(self._get_poll_plan(frozenset(POLL_TIERS))),
+            len(self._get_poll_plan(frozenset((POLL_TIER_FAST,)))),
+        )
+        
+        # Tier scheduling: when each tier was last read and which tiers must
+        # be read on the next poll regardless of their cadence
+        self._tier_last_read: dict[str, float] = {}
+        self._pending_tiers: set[str] = set(POLL_TIERS)
+        
+        # When each key was last published by a write, so a poll that read
+        # the key before the write doesn't overwrite the newer value
+        self._written_at: dict[str, float] = {}
+        
+        # Debounced writes waiting for their quiet period, and the addresses
+        # of those being sent; polls leave these values alone
+        self._debounced_writes: dict[str, tuple[float | int, asyncio.TimerHandle]] = {}
+        self._debounced_in_flight: set[int] = set()
         
         # Storage for static data (read once)
         self._static_data: dict[str, Any] = {}
         self._static_data_read = False
 
-        self._client = ModbusTcpClient(host=self.host, port=self.port)
-        self._lock = threading.Lock()
+        # I/O runs on the event loop; the executor transport only hands the
+        # blocking socket calls themselves to a worker thread. Units behind
+        # the same host:port share one session, which also picks up a
+        # session left open by config flow detection.
+        self._gateway = async_acquire_gateway(hass, entry.data)
+        self._transport = self._gateway.unit(self.slave_id)
+        self._gateway_released = False
+        # Polls run one at a time; individual requests from polls and writes
+        # of every unit on the gateway share the session through its
+        # scheduler, writes first and units taking turns
+        self._poll_lock = asyncio.Lock()
+        self._scheduler = self._gateway.scheduler
+        _LOGGER.debug(
+            "Using %s transport for %s",
+            entry.data.get(CONF_IO_MODE, DEFAULT_IO_MODE),
+            self.host,
+        )
+        
+        # Keep the TCP session open between polls instead of cycling it
+        self._persistent = entry.data.get(
+            CONF_PERSISTENT_CONNECTION, DEFAULT_PERSISTENT_CONNECTION
+        )
+        # A session that is already open was just handed over by detection
+        # (or is in use by another unit), so the first poll skips the flush
+        # reconnect and reads on it straight away
+        self._session_handed_over = self._transport.connected
+        self._connect_failures = 0
+        self._reconnect_at = 0.0
+        # Set when a session ends because of an error, to count reconnects
+        self._session_lost = False
+        
+        # Rolling health figures exposed as diagnostic sensors, and the most
+        # recent requests for the diagnostics download
+        self.metrics = ModbusMetrics(METRICS_WINDOW)
+        self.request_log = RequestLog(REQUEST_LOG_SIZE)
+        
+        # A day of polled values in raw int16 columns, for windowed queries
+        # without going through the recorder
+        self.history = RegisterHistory(
+            self._register_map.poll_registers, math.ceil(HISTORY_DURATION / scan_interval)
+        )
+        # Efficiency, trends and defrost cycles, folded in once per poll
+        self.ventilation = VentilationMetrics()
+        
+        # Last polled values in HA storage, restored at startup; restored
+        # data stays stale until the first poll succeeds
+        self._snapshot_store = SnapshotStore(hass, entry.entry_id)
+        self._data_read_at: float | None = None
+        self.stale = False
+        
+        # Snapshot, success and stale flags entities were last notified
+        # about, so updates only wake entities whose keys changed
+        self._notified_data: dict[str, Any] | None = None
+        self._notified_success = True
+        self._notified_stale = False
+        
+        # Sentinel fast lane: between full polls a few live-state registers
+        # are checked and a refresh starts as soon as one of them changes
+        self._sentinel_interval = entry.data.get(
+            CONF_SENTINEL_INTERVAL, DEFAULT_SENTINEL_INTERVAL
+        )
+        self._sentinel_handle: asyncio.TimerHandle | None = None
+        self._shutting_down = False
+        self.sentinel_checks = 0
+        self.sentinel_triggers = 0
+        
+        # Learned inter-request delay, carried over from previous runs; on
+        # RTU buses it never drops below the inter-frame silence
+        self._pacer = AdaptivePacer(
+            entry.data.get(CONF_REQUEST_DELAY, PACING_INITIAL_DELAY),
+            self._transport.min_request_gap,
+        )
         
         super().__init__(
             hass,
@@ -96,57 +233,73 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Parmair via Modbus."""
         try:
-            return await self.hass.async_add_executor_job(self._read_modbus_data)
+            return await self._async_read_modbus_data()
         except ModbusException as err:
             raise UpdateFailed(f"Error communicating with Parmair device: {err}") from err
+        finally:
+            self._schedule_sentinel_check()
 
-    def _read_modbus_data(self) -> dict[str, Any]:
-        """Read data from Modbus (runs in executor)."""
-        with self._lock:
-            # Close and reconnect to flush any stale responses in buffer
-            if self._client.connected:
-                try:
-                    self._client.close()
-                except:
-                    pass  # Ignore close errors
-            
-            if not self._client.connect():
-                raise ModbusException("Failed to connect to Modbus device")
-            
-            # Set slave/unit ID on the client
-            _set_unit_id(self._client, self.slave_id)
+    async def _async_read_modbus_data(self) -> dict[str, Any]:
+        """Read data from Modbus."""
+        async with self._poll_lock:
+            poll_started = time.monotonic()
+            requests_before = self.metrics.requests
             
-            # Longer delay after connect to allow device to stabilize and clear buffers
-            time.sleep(0.3)
+            async with self._scheduler.async_slot(REQUEST_PRIORITY_POLL, self.slave_id):
+                if not self._persistent and not self._session_handed_over:
+                    # Close and reconnect to flush any stale responses in buffer
+                    await self._async_disconnect()
+                self._session_handed_over = False
+                
+                await self._async_ensure_connected()
             
             # Read static registers once on first poll
             if not self._static_data_read:
-                _LOGGER.info("Reading static device information (one-time read)")
-                for definition in self._static_registers:
-                    value = self._read_register_value(definition)
-                    if value is not None:
-                        self._static_data[definition.key] = value
-                        _LOGGER.debug(
-                            "Static register %s: %s",
-                            definition.label,
-                            value,
-                        )
-                    time.sleep(0.2)
-                self._static_data_read = True
+                self._static_data_read = await self._async_read_static_data()
+            
+            now = time.monotonic()
+            due_tiers = self._due_tiers(now)
             
-            data: dict[str, Any] = {}
+            # Carry over values from tiers that are not due this cycle
+            previous = self.data or {}
+            data: dict[str, Any] = {
+                definition.key: previous[definition.key]
+                for definition in self._poll_registers
+                if definition.poll_tier not in due_tiers and definition.key in previous
+            }
             failed_registers = []
+            read_at: dict[str, float] = {}
 
             try:
-                # Read dynamic registers on every poll
-                for definition in self._poll_registers:
-                    value = self._read_register_value(definition)
-                    if value is None:
-                        failed_registers.append(f"{definition.label}({definition.register_id})")
-                        continue
-                    data[definition.key] = value
-                    # Longer delay between reads to prevent transaction ID conflicts
-                    time.sleep(0.2)
+                # Read registers from the due tiers, one request per block
+                for block in self._get_poll_plan(due_tiers):
+                    values = await self._async_read_block(block)
+                    if values is not None:
+                        block_read_at = time.monotonic()
+                        read_at.update(
+                            (definition.key, block_read_at)
+                            for definition in block.definitions
+                        )
+                    
+                    if values is None:
+                        # Fall back to single reads so one bad address doesn't
+                        # take down the whole block; aliased keys share a read
+                        values = {}
+                        for _, aliases in block.by_address():
+                            raw = await self._async_read_register_raw(aliases[0])
+                            address_read_at = time.monotonic()
+                            for definition in aliases:
+                                values[definition.key] = (
+                                    None if raw is None else self._decode_value(definition, raw)
+                                )
+                                read_at[definition.key] = address_read_at
+                    
+                    for definition in block.definitions:
+                        value = values.get(definition.key)
+                        if value is None:
+                            failed_registers.append(f"{definition.label}({definition.register_id})")
+                            continue
+                        data[definition.key] = value
                 
                 if failed_registers:
                     _LOGGER.debug(
@@ -158,6 +311,26 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Merge static data with dynamic data
                 data.update(self._static_data)
                 
+                # Keep values written while this poll was running
+                for key, written_at in list(self._written_at.items()):
+                    if written_at < now:
+                        del self._written_at[key]
+                    elif read_at.get(key, 0.0) < written_at and key in (self.data or {}):
+                        data[key] = self.data[key]
+                
+                # Keep optimistic values of debounced writes not yet confirmed
+                debounced_addresses = self._debounced_in_flight | {
+                    self._registers[key].address for key in self._debounced_writes
+                }
+                for address in debounced_addresses:
+                    for key in self._register_map.keys_at(address):
+                        if key in data and key in (self.data or {}):
+                            data[key] = self.data[key]
+                
+                for tier in due_tiers:
+                    self._tier_last_read[tier] = now
+                self._pending_tiers.difference_update(due_tiers)
+                
                 _LOGGER.debug(
                     "Read data from Parmair %s: %d values (%d static, %d dynamic)",
                     self.host,
@@ -165,44 +338,519 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     len(self._static_data),
                     len(data) - len(self._static_data),
                 )
+                polled_at = time.time()
+                # Only values read by this poll; carried-over tiers would
+                # look like fresh samples
+                self.history.record(
+                    polled_at, {key: data[key] for key in read_at if key in data}
+                )
+                self.ventilation.update(polled_at, data)
+                self.stale = False
+                self._data_read_at = polled_at
+                self._snapshot_store.async_schedule_save(self._snapshot_data)
+                self._persist_request_delay()
+                self.metrics.record_poll(
+                    time.monotonic() - poll_started,
+                    self.metrics.requests - requests_before,
+                )
                 return data
                 
             except Exception as ex:
                 _LOGGER.error("Error reading from Modbus: %s", ex)
+                self.metrics.record_failed_poll()
+                # Start the next poll from a fresh session
+                self._session_lost = True
+                async with self._scheduler.async_slot(REQUEST_PRIORITY_POLL, self.slave_id):
+                    await self._async_disconnect()
                 raise ModbusException(f"Failed to read data: {ex}") from ex
             finally:
-                # Always close after reading to prevent buffer buildup
+                if not self._persistent:
+                    # Close after reading to prevent buffer buildup
+                    async with self._scheduler.async_slot(REQUEST_PRIORITY_POLL, self.slave_id):
+                        await self._async_disconnect()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the last known values so entities can be set up at once.
+        
+        Returns False without a usable snapshot, in which case setup has to
+        wait for a first poll.
+        """
+        restored = await self._snapshot_store.async_load(self.software_version)
+        if restored is None:
+            return False
+        data, read_at = restored
+        self.data = data
+        self._data_read_at = read_at
+        self.stale = True
+        _LOGGER.debug(
+            "Restored %d values of %s read %.0fs ago",
+            len(data),
+            self.host,
+            time.time() - read_at,
+        )
+        return True
+
+    @callback
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the snapshot to store: the values and when they were read."""
+        return {
+            CONF_SOFTWARE_VERSION: self.software_version,
+            "read_at": self._data_read_at,
+            "data": dict(self.data or {}),
+        }
+
+    async def _async_read_static_data(self) -> bool:
+        """Load static device information, returning True once it is validated.
+
+        The static registers are cached in the config entry. A single read of
+        the software version register fingerprints the device; the remaining
+        static registers are only read again when it changed, e.g. after a
+        firmware update.
+        """
+        fingerprint = self._registers[REG_SOFTWARE_VERSION]
+        raw = await self._async_read_register_raw(fingerprint)
+        cached = self.entry.data.get(CONF_DEVICE_IDENTITY) or {}
+        cache_valid = (
+            cached.get(CONF_SOFTWARE_VERSION) == self.software_version
+            and "static" in cached
+        )
+        
+        if raw is None:
+            # Keep serving the cached identity and validate on the next poll
+            if cache_valid:
+                self._static_data = dict(cached["static"])
+            return False
+        
+        if cache_valid and cached.get("fingerprint") == raw:
+            _LOGGER.debug("Device identity of %s unchanged, using cached static data", self.host)
+            self._static_data = dict(cached["static"])
+            if self.absent_modules:
+                # Pick up a module fitted since the last probe
+                absent = await self._async_probe_modules(self.absent_modules)
+                if absent != self.absent_modules:
+                    self._store_identity(raw, self._static_data, absent)
+                    self._set_absent_modules(absent)
+            return True
+        
+        _LOGGER.info("Reading static device information (one-time read)")
+        static: dict[str, Any] = {}
+        if (value := self._decode_value(fingerprint, raw)) is not None:
+            static[fingerprint.key] = value
+        remaining = [
+            definition
+            for definition in self._static_registers
+            if definition.address != fingerprint.address
+        ]
+        for block in build_read_plan(remaining, self._max_read_gap, self._max_block_size):
+            values = await self._async_read_block(block)
+            if values is None:
+                values = {
+                    definition.key: await self._async_read_register_value(definition)
+                    for definition in block.definitions
+                }
+            static.update((key, value) for key, value in values.items() if value is not None)
+        
+        for key, value in static.items():
+            _LOGGER.debug("Static register %s: %s", key, value)
+        self._static_data = static
+        
+        # New device or firmware: find out which sensor modules it has
+        absent = await self._async_probe_modules(OPTIONAL_MODULE_REGISTER_KEYS)
+        
+        # The probe result is stored before a change can reload the entry,
+        # even when an incomplete static read has to be repeated next time
+        self._store_identity(
+            raw, static if len(static) == len(self._static_registers) else None, absent
+        )
+        self._set_absent_modules(absent)
+        return True
+
+    def _store_identity(
+        self, fingerprint: int, static: dict[str, Any] | None, absent: frozenset[str]
+    ) -> None:
+        """Cache the static registers and probed modules in the config entry.
+        
+        Without static data only the probed modules are kept, so the static
+        registers are read again at the next startup.
+        """
+        identity: dict[str, Any] = {
+            CONF_SOFTWARE_VERSION: self.software_version,
+            "fingerprint": fingerprint,
+            "absent_modules": sorted(absent),
+        }
+        if static is not None:
+            identity["static"] = static
+        self.hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, CONF_DEVICE_IDENTITY: identity}
+        )
+
+    async def _async_probe_modules(self, keys: Iterable[str]) -> frozenset[str]:
+        """Return which of the optional module registers report no module.
+        
+        A module is absent when its register is refused, or reads 0 or -1 on
+        MODULE_PROBE_READS reads in a row; a calibrating sensor reads -1 too,
+        but not for long. A request that gets no answer says nothing, so the
+        module is then assumed present.
+        """
+        refused = set()
+        candidates = [
+            definition
+            for key in keys
+            if (definition := self._registers.get(key)) is not None
+        ]
+        for attempt in range(MODULE_PROBE_READS):
+            if not candidates:
+                break
+            if attempt:
+                await asyncio.sleep(MODULE_PROBE_INTERVAL)
+            reading_absent = []
+            for definition in candidates:
                 try:
-                    self._client.close()
-                except:
-                    pass
+                    registers = await self._async_read_raw_registers(definition.address, 1)
+                except ModbusException as err:
+                    _LOGGER.debug(
+                        "Could not probe %s on %s: %s", definition.key, self.host, err
+                    )
+                    continue
+                if registers is None:
+                    refused.add(definition.key)
+                elif registers[0] in ABSENT_MODULE_VALUES:
+                    reading_absent.append(definition)
+            candidates = reading_absent
+        return frozenset(refused.union(definition.key for definition in candidates))
 
-    def write_register(self, key: str, value: float | int) -> bool:
-        """Write a value to a Modbus register respecting scaling with pymodbus 3.x."""
-        definition = get_register_definition(key)
+    def _present_poll_registers(self) -> tuple[RegisterDefinition, ...]:
+        """Return the polled registers, without those of absent modules."""
+        return tuple(
+            definition
+            for definition in self._register_map.poll_registers
+            if definition.key not in self.absent_modules
+        )
+
+    @callback
+    def _set_absent_modules(self, absent: frozenset[str]) -> None:
+        """Stop or resume polling optional modules after a probe."""
+        if absent == self.absent_modules:
+            return
+        _LOGGER.info(
+            "Optional modules absent on %s: %s",
+            self.host,
+            ", ".join(sorted(absent)) or "none",
+        )
+        self.absent_modules = absent
+        self._poll_registers = self._present_poll_registers()
+        if self._listeners and not self.stale:
+            # Entities exist per module, so set the platforms up again. Right
+            # after a restore the stored set applies from the next start
+            # instead, so a module that reads absent for a while can't keep
+            # reloading the entry
+            self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose data keys changed since the last update.
+
+        Entities pass the keys they render as their coordinator context.
+        Listeners without a key set, and every listener after availability
+        or the stale flag changed, are always notified.
+        """
+        data = self.data
+        previous = self._notified_data
+        if (
+            data is None
+            or previous is None
+            or self.last_update_success != self._notified_success
+            or self.stale != self._notified_stale
+        ):
+            changed = None
+        else:
+            changed = {
+                key
+                for key in data.keys() | previous.keys()
+                if data.get(key) != previous.get(key)
+            }
+        self._notified_data = data
+        self._notified_success = self.last_update_success
+        self._notified_stale = self.stale
+        
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                changed is None
+                or not isinstance(context, frozenset)
+                or not changed.isdisjoint(context)
+            ):
+                update_callback()
+
+    @callback
+    def _schedule_sentinel_check(self) -> None:
+        """Schedule the next sentinel check, replacing a pending one."""
+        if self._sentinel_handle is not None:
+            self._sentinel_handle.cancel()
+            self._sentinel_handle = None
+        if self._sentinel_interval and not self._shutting_down:
+            self._sentinel_handle = self.hass.loop.call_later(
+                self._sentinel_interval, self._async_start_sentinel_check
+            )
+
+    @callback
+    def _async_start_sentinel_check(self) -> None:
+        """Run a sentinel check once its interval has passed."""
+        self._sentinel_handle = None
+        self.hass.async_create_task(self._async_check_sentinels())
+
+    async def _async_check_sentinels(self) -> None:
+        """Read the sentinel registers and refresh at once if one changed.
+        
+        A refresh restarts the regular update interval, so the full polls
+        are only brought forward, not added. Failed checks are left to the
+        next full poll.
+        """
+        changed = False
         try:
-            with self._lock:
-                if not self._client.connected:
-                    if not self._client.connect():
+            # Skip while a poll runs, while nobody listens and while the
+            # device is unavailable (full polls handle reconnecting)
+            if (
+                self._poll_lock.locked()
+                or not self._listeners
+                or not self.last_update_success
+                or self.data is None
+            ):
+                return
+            changed = await self._async_sentinels_changed()
+        except ModbusException as err:
+            _LOGGER.debug("Sentinel check on %s failed: %s", self.host, err)
+        finally:
+            if not changed:
+                self._schedule_sentinel_check()
+        
+        if changed:
+            self.sentinel_triggers += 1
+            # Reschedules the next check once the refresh completes
+            await self.async_refresh()
+
+    async def _async_sentinels_changed(self) -> bool:
+        """Return True if a sentinel register differs from the last snapshot."""
+        async with self._poll_lock:
+            async with self._scheduler.async_slot(REQUEST_PRIORITY_POLL, self.slave_id):
+                await self._async_ensure_connected()
+            
+            self.sentinel_checks += 1
+            try:
+                # Keys with writes in flight are the integration's own changes
+                pending = set(self._written_at) | set(self._debounced_writes)
+                for block in self._register_map.sentinel_plan:
+                    values = await self._async_read_block(block)
+                    if values is None:
                         return False
-                
-                # Set unit ID on client
-                _set_unit_id(self._client, self.slave_id)
+                    for key, value in values.items():
+                        if (
+                            value is not None
+                            and key not in pending
+                            and value != self.data.get(key)
+                        ):
+                            _LOGGER.debug(
+                                "Sentinel %s on %s changed from %s to %s, refreshing",
+                                key,
+                                self.host,
+                                self.data.get(key),
+                                value,
+                            )
+                            return True
+                return False
+            finally:
+                if not self._persistent:
+                    async with self._scheduler.async_slot(
+                        REQUEST_PRIORITY_POLL, self.slave_id
+                    ):
+                        await self._async_disconnect()
 
-                raw_value = self._to_raw(definition, value)
-                
-                # Write using pymodbus 3.x API
-                result = self._client.write_register(definition.address, raw_value)
-                
-                _LOGGER.debug(
-                    "Wrote %s to register %s (%d): raw=%d",
-                    value, definition.label, definition.address, raw_value
+    def _due_tiers(self, now: float) -> frozenset[str]:
+        """Return the polling tiers that should be read at this update."""
+        # Allow half an update interval of jitter so a tier isn't pushed
+        # back a whole cycle by scheduling drift
+        tolerance = (
+            self.update_interval.total_seconds() / 2 if self.update_interval else 0
+        )
+        due = set(self._pending_tiers)
+        for tier, interval in POLL_TIER_INTERVALS.items():
+            last_read = self._tier_last_read.get(tier)
+            if last_read is None or now - last_read >= interval - tolerance:
+                due.add(tier)
+        return frozenset(due)
+
+    def _get_poll_plan(self, tiers: frozenset[str]) -> tuple[ReadBlock, ...]:
+        """Return the cached block read plan for a set of polling tiers."""
+        return self._register_map.poll_plan(
+            tiers, self._max_read_gap, self._max_block_size, self.absent_modules
+        )
+
+    async def _async_ensure_connected(self) -> None:
+        """Open the Modbus session if needed, backing off after failed attempts."""
+        if self._transport.connected:
+            return
+        
+        now = time.monotonic()
+        if now < self._reconnect_at:
+            raise ModbusException(
+                f"Waiting {self._reconnect_at - now:.0f}s before reconnecting to {self.host}"
+            )
+        
+        if not await self._transport.async_connect():
+            self._connect_failures += 1
+            backoff = min(
+                RECONNECT_BACKOFF_MAX,
+                RECONNECT_BACKOFF_MIN * 2 ** (self._connect_failures - 1),
+            )
+            self._reconnect_at = now + backoff
+            raise ModbusException(
+                f"Failed to connect to Modbus device (retry in {backoff:.0f}s)"
+            )
+        
+        if self._session_lost:
+            self.metrics.record_reconnect()
+            self._session_lost = False
+        if self._connect_failures:
+            _LOGGER.info(
+                "Reconnected to Parmair %s after %d failed attempts",
+                self.host,
+                self._connect_failures,
+            )
+        self._connect_failures = 0
+        self._reconnect_at = 0.0
+        
+        # Allow device to stabilize and clear buffers before the first request
+        self._pacer.connected()
+
+    def _persist_request_delay(self) -> None:
+        """Save the learned request delay so it survives restarts."""
+        delay = round(self._pacer.delay, 3)
+        stored = self.entry.data.get(CONF_REQUEST_DELAY)
+        if stored is not None and abs(delay - stored) < PACING_PERSIST_THRESHOLD:
+            return
+        
+        _LOGGER.debug("Learned request delay for %s: %.3fs", self.host, delay)
+        self.hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, CONF_REQUEST_DELAY: delay}
+        )
+
+    async def _async_disconnect(self) -> None:
+        """Close the Modbus session, ignoring errors.
+
+        A session shared with other units stays open unless it was lost.
+        """
+        if self._transport.connected:
+            try:
+                await self._transport.async_close(force=self._session_lost)
+            except Exception:  # pylint: disable=broad-except
+                pass  # Ignore close errors
+
+    async def _async_request(
+        self, method, *args: Any, priority: int = REQUEST_PRIORITY_POLL
+    ) -> Any:
+        """Issue one paced Modbus request and feed its outcome to the pacer."""
+        async with self._scheduler.async_slot(priority, self.slave_id):
+            await self._async_ensure_connected()
+            await self._pacer.async_wait()
+            
+            # Every request starts with the register address, followed by
+            # the count for reads or the value(s) for writes
+            function_code = _FUNCTION_CODES.get(getattr(method, "__name__", ""), 0)
+            address = args[0]
+            if function_code == 3:
+                count = args[1]
+            elif function_code == 16:
+                count = len(args[1])
+            else:
+                count = 1
+            
+            timestamp = time.time()
+            started = time.monotonic()
+            try:
+                result = await method(*args)
+            except ModbusIOException as err:
+                self._pacer.record_failure()
+                if _is_transaction_mismatch(err):
+                    self.metrics.record_transaction_mismatch()
+                    outcome = "transaction_mismatch"
+                else:
+                    self.metrics.record_timeout()
+                    outcome = "timeout"
+                self.request_log.record(
+                    timestamp, function_code, address, count, priority, None,
+                    time.monotonic() - started, outcome, str(err),
                 )
-                
-                # Small delay after write to allow device to process
-                time.sleep(0.2)
-                
-                return not result.isError() if hasattr(result, 'isError') else result is not None
+                await self._async_resync(err)
+                raise
+            except ConnectionException as err:
+                self._pacer.record_failure()
+                self.metrics.record_connection_error()
+                self.request_log.record(
+                    timestamp, function_code, address, count, priority, None,
+                    time.monotonic() - started, "connection_error", str(err),
+                )
+                self._session_lost = True
+                await self._async_disconnect()
+                raise
+            
+            latency = time.monotonic() - started
+            # Judge the device's turnaround without the time frames spend on
+            # a serial bus, so long block reads don't look like congestion
+            self._pacer.record_success(
+                max(0.0, latency - self._transport.wire_time(function_code, count))
+            )
+            self.metrics.record_request(address, latency)
+            is_error = result is None or (hasattr(result, "isError") and result.isError())
+            self.request_log.record(
+                timestamp,
+                function_code,
+                address,
+                count,
+                priority,
+                getattr(result, "transaction_id", None),
+                latency,
+                "exception_response" if is_error else "ok",
+                str(result) if is_error else None,
+            )
+            return result
+
+    async def _async_resync(self, err: ModbusIOException) -> None:
+        """Bring request and response streams back in step after an I/O error."""
+        if _is_transaction_mismatch(err):
+            _LOGGER.warning("Transaction ID mismatch on %s, resynchronising: %s", self.host, err)
+        else:
+            _LOGGER.debug("Modbus I/O error on %s, resynchronising: %s", self.host, err)
+        
+        if not await self._transport.async_drain():
+            # Buffer could not be drained, fall back to a fresh session
+            self._session_lost = True
+            await self._async_disconnect()
+
+    async def async_write_register(self, key: str, value: float | int) -> bool:
+        """Write a value to a Modbus register respecting scaling with pymodbus 3.x."""
+        definition = self.get_register_definition(key)
+        started = time.monotonic()
+        try:
+            raw_value = self._to_raw(definition, value)
+            
+            # Write using pymodbus 3.x API, ahead of any queued poll reads
+            result = await self._async_request(
+                self._transport.async_write_register,
+                definition.address,
+                raw_value,
+                priority=REQUEST_PRIORITY_WRITE,
+            )
+            
+            _LOGGER.debug(
+                "Wrote %s to register %s (%d): raw=%d",
+                value, definition.label, definition.address, raw_value
+            )
+            
+            success = not result.isError() if hasattr(result, 'isError') else result is not None
+            if success:
+                self._apply_writes([(definition, raw_value)])
+                await self._async_read_back([definition])
+                self.metrics.record_write(time.monotonic() - started)
+            return success
         except Exception as ex:
             _LOGGER.error(
                 "Error writing to Modbus register %s (%s): %s",
@@ -212,19 +860,195 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return False
 
-    async def async_write_register(self, key: str, value: float | int) -> bool:
-        """Write a value to a Modbus register (async)."""
+    @callback
+    def async_write_register_debounced(self, key: str, value: float | int) -> None:
+        """Publish a value at once and write it after a quiet period.
+        
+        Repeated calls for the same key within the period restart it, so only
+        the last value reaches the device, followed by a single read-back.
+        """
+        definition = self.get_register_definition(key)
+        if (pending := self._debounced_writes.pop(key, None)) is not None:
+            pending[1].cancel()
+        
+        handle = self.hass.loop.call_later(
+            WRITE_DEBOUNCE_DELAY, self._async_flush_debounced_write, key
+        )
+        self._debounced_writes[key] = (value, handle)
+        self._apply_writes([(definition, self._to_raw(definition, value))])
 
-        return await self.hass.async_add_executor_job(self.write_register, key, value)
+    @callback
+    def _async_flush_debounced_write(self, key: str) -> None:
+        """Send the last value of a debounced write once its period ends."""
+        value, _ = self._debounced_writes.pop(key)
+        self.hass.async_create_task(self._async_write_debounced(key, value))
 
-    async def async_shutdown(self) -> None:
-        """Close the Modbus connection."""
-        def _close():
-            with self._lock:
-                if self._client.connected:
-                    self._client.close()
+    async def _async_write_debounced(self, key: str, value: float | int) -> None:
+        """Write a debounced value, restoring polling of it afterwards."""
+        definition = self.get_register_definition(key)
+        self._debounced_in_flight.add(definition.address)
+        try:
+            if not await self.async_write_register(key, value):
+                _LOGGER.warning("Debounced write of %s to %s failed", value, key)
+                # Let the next poll show what the device actually holds
+                self._pending_tiers.add(definition.poll_tier)
+        finally:
+            self._debounced_in_flight.discard(definition.address)
+
+    async def async_write_many(self, values: dict[str, float | int]) -> bool:
+        """Write several registers, batching contiguous addresses into FC16 writes.
+        
+        Args:
+            values: Register keys mapped to the values to write
+        
+        Returns:
+            True if every block was written successfully
+        
+        Raises:
+            ValueError: If a key is unknown, not writable or two aliased keys
+                disagree on the value
+        """
+        writes = []
+        for key, value in values.items():
+            try:
+                definition = self.get_register_definition(key)
+            except KeyError as err:
+                raise ValueError(f"Unknown register '{key}'") from err
+            if not definition.writable:
+                raise ValueError(f"Register '{key}' is not writable")
+            writes.append((definition, self._to_raw(definition, value)))
+        
+        plan = build_write_plan(writes, max_block_size=self._max_block_size)
+        started = time.monotonic()
+        written: list[tuple[RegisterDefinition, int]] = []
+        success = True
+        
+        for block in plan:
+            try:
+                if block.count == 1:
+                    result = await self._async_request(
+                        self._transport.async_write_register,
+                        block.address,
+                        block.values[0],
+                        priority=REQUEST_PRIORITY_WRITE,
+                    )
+                else:
+                    result = await self._async_request(
+                        self._transport.async_write_registers,
+                        block.address,
+                        list(block.values),
+                        priority=REQUEST_PRIORITY_WRITE,
+                    )
+            except Exception as ex:
+                _LOGGER.error(
+                    "Error writing %d registers at address %d: %s",
+                    block.count,
+                    block.address,
+                    ex,
+                )
+                success = False
+                continue
+            
+            if result is None or (hasattr(result, 'isError') and result.isError()):
+                _LOGGER.error(
+                    "Device rejected write of %d registers at address %d: %s",
+                    block.count,
+                    block.address,
+                    result,
+                )
+                success = False
+                continue
+            
+            _LOGGER.debug(
+                "Wrote %s to registers %d-%d",
+                ", ".join(definition.key for definition in block.definitions),
+                block.address,
+                block.address + block.count - 1,
+            )
+            written.extend(
+                (definition, block.values[definition.address - block.address])
+                for definition in block.definitions
+            )
         
-        await self.hass.async_add_executor_job(_close)
+        # One optimistic update and one combined read-back for everything written
+        if written:
+            self._apply_writes(written)
+            await self._async_read_back([definition for definition, _ in written])
+            self.metrics.record_write(time.monotonic() - started)
+        return success
+
+    def _apply_writes(self, writes: list[tuple[RegisterDefinition, int]]) -> None:
+        """Optimistically publish written raw values, including aliased keys."""
+        if self.data is None:
+            return
+        
+        data = dict(self.data)
+        written_at = time.monotonic()
+        polled_keys = self._register_map.polled_keys
+        for definition, raw in writes:
+            for key in self._register_map.keys_at(definition.address):
+                if key in polled_keys:
+                    data[key] = self._decode_value(self._registers[key], raw)
+                    self._written_at[key] = written_at
+        self.async_set_updated_data(data)
+
+    async def _async_read_back(self, definitions: list[RegisterDefinition]) -> None:
+        """Read back written registers and the registers that depend on them."""
+        polled_keys = self._register_map.polled_keys
+        keys = {
+            key
+            for definition in definitions
+            for key in (definition.key, *WRITE_DEPENDENTS.get(definition.key, ()))
+        }
+        plan = build_read_plan(
+            [
+                self._registers[key]
+                for key in keys
+                if key in polled_keys and key in self._registers
+            ],
+            max_gap=self._max_read_gap,
+            max_block_size=self._max_block_size,
+        )
+        if not plan or self.data is None:
+            return
+        
+        data = dict(self.data)
+        for block in plan:
+            values = await self._async_read_block(block, REQUEST_PRIORITY_WRITE)
+            if values is None:
+                # Leave it to the next poll to pick these up
+                self._pending_tiers.update(
+                    block_definition.poll_tier for block_definition in block.definitions
+                )
+                continue
+            
+            read_at = time.monotonic()
+            for key, value in values.items():
+                if value is not None:
+                    data[key] = value
+                    self._written_at[key] = read_at
+        
+        self.async_set_updated_data(data)
+
+    async def async_shutdown(self) -> None:
+        """Send pending debounced writes and close the Modbus connection."""
+        self._shutting_down = True
+        if self._sentinel_handle is not None:
+            self._sentinel_handle.cancel()
+            self._sentinel_handle = None
+        await super().async_shutdown()
+        pending = self._debounced_writes
+        self._debounced_writes = {}
+        for key, (value, handle) in pending.items():
+            handle.cancel()
+            await self._async_write_debounced(key, value)
+        async with self._scheduler.async_slot(REQUEST_PRIORITY_WRITE, self.slave_id):
+            await self._async_disconnect()
+        if self.data and self._data_read_at is not None:
+            await self._snapshot_store.async_save(self._snapshot_data())
+        if not self._gateway_released:
+            self._gateway_released = True
+            async_release_gateway(self.hass, self._gateway)
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -253,19 +1077,175 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         return device_info
 
+    def register_name(self, address: int) -> str:
+        """Return a readable name for a register address, for diagnostics."""
+        keys = self._register_map.keys_at(address)
+        return f"{'/'.join(keys) if keys else 'unmapped'} ({address})"
+
+    @property
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """Return the health metrics with per-register latencies."""
+        return {
+            **self.metrics.as_dict(),
+            "request_delay_ms": round(self._pacer.delay * 1000, 1),
+            "register_latency": self.metrics.register_latencies(self.register_name),
+        }
+
+    def diagnostics_data(self) -> dict[str, Any]:
+        """Return the transport state, poll plan, pacing and recent requests."""
+        now = time.monotonic()
+        return {
+            "io_mode": self.entry.data.get(CONF_IO_MODE, DEFAULT_IO_MODE),
+            "stale": self.stale,
+            "data_age_s": (
+                round(time.time() - self._data_read_at)
+                if self._data_read_at is not None
+                else None
+            ),
+            "persistent_connection": self._persistent,
+            "connected": self._transport.connected,
+            "gateway": {
+                "transport": self._gateway.settings[0],
+                "io_mode": self._gateway.settings[1],
+                "baudrate": self._transport.baudrate,
+                "units": self._gateway.users,
+                "pending_requests": self._scheduler.pending,
+            },
+            "software_version": self.software_version,
+            "absent_modules": sorted(self.absent_modules),
+            "poll_plan": [
+                {
+                    "address": block.address,
+                    "count": block.count,
+                    "keys": [definition.key for definition in block.definitions],
+                }
+                for block in self._get_poll_plan(frozenset(POLL_TIERS))
+            ],
+            "tiers": {
+                tier: {
+                    "interval": POLL_TIER_INTERVALS[tier],
+                    "last_read_ago": (
+                        round(now - self._tier_last_read[tier], 1)
+                        if tier in self._tier_last_read
+                        else None
+                    ),
+                    "pending": tier in self._pending_tiers,
+                }
+                for tier in POLL_TIERS
+            },
+            "history": {
+                "capacity": self.history.capacity,
+                "samples": self.history.size,
+                "span_s": round(self.history.span),
+                "bytes": self.history.nbytes,
+                "last_hour": {
+                    definition.key: summary
+                    for definition in self._poll_registers
+                    if (summary := self.history.summary(
+                        definition.key, HISTORY_DIAGNOSTICS_WINDOW
+                    ))["count"]
+                },
+            },
+            "ventilation": self.ventilation.as_dict(),
+            "sentinel": {
+                "interval": self._sentinel_interval,
+                "plan": [
+                    {"address": block.address, "count": block.count}
+                    for block in self._register_map.sentinel_plan
+                ],
+                "checks": self.sentinel_checks,
+                "triggered_refreshes": self.sentinel_triggers,
+            },
+            "pacing": {
+                "delay_ms": round(self._pacer.delay * 1000, 1),
+                "latency_ms": (
+                    round(self._pacer.latency * 1000, 1)
+                    if self._pacer.latency is not None
+                    else None
+                ),
+                "min_delay_ms": round(self._pacer.min_delay * 1000, 2),
+                "max_delay_ms": PACING_MAX_DELAY * 1000,
+                "max_read_gap": self._max_read_gap,
+                "max_block_size": self._max_block_size,
+            },
+            "metrics": self.metrics_snapshot,
+            "requests_total": self.request_log.total,
+            "requests": [
+                {**entry, "register": self.register_name(entry["address"])}
+                for entry in self.request_log.entries()
+            ],
+        }
+
     def get_register_definition(self, key: str) -> RegisterDefinition:
         """Expose register metadata for other components."""
         return get_register_definition(key, self._registers)
 
-    def _read_register_value(self, definition: RegisterDefinition) -> Any | None:
-        """Read and scale a single register with pymodbus 3.x."""
+    async def _async_read_raw_registers(
+        self, address: int, count: int, priority: int = REQUEST_PRIORITY_POLL
+    ) -> list[int] | None:
+        """Read a run of raw holding registers with pymodbus 3.x."""
+        # Read using pymodbus 3.x API (unit ID already set on client)
+        result = await self._async_request(
+            self._transport.async_read_holding_registers, address, count, priority=priority
+        )
+        
+        if not result or (hasattr(result, "isError") and result.isError()):
+            return None
+        
+        if hasattr(result, "registers"):
+            registers = list(result.registers)
+        elif isinstance(result, (list, tuple)):
+            registers = list(result)
+        else:
+            registers = [result]
+        
+        if len(registers) < count:
+            return None
+        return registers
+
+    async def _async_read_block(
+        self, block: ReadBlock, priority: int = REQUEST_PRIORITY_POLL
+    ) -> dict[str, Any] | None:
+        """Read a block of registers and decode it into per-key values."""
         try:
-            # Read using pymodbus 3.x API (unit ID already set on client)
-            result = self._client.read_holding_registers(
-                address=definition.address, count=1
+            registers = await self._async_read_raw_registers(
+                block.address, block.count, priority
+            )
+        except Exception as ex:
+            _LOGGER.debug(
+                "Exception reading block %d-%d: %s",
+                block.address,
+                block.end - 1,
+                ex,
+            )
+            return None
+        
+        if registers is None:
+            _LOGGER.debug(
+                "Failed reading block %d-%d",
+                block.address,
+                block.end - 1,
             )
+            return None
+        
+        return {
+            definition.key: self._decode_value(definition, raw)
+            for definition, raw in block.split(registers)
+        }
+
+    async def _async_read_register_value(self, definition: RegisterDefinition) -> Any | None:
+        """Read and scale a single register with pymodbus 3.x."""
+        raw = await self._async_read_register_raw(definition)
+        if raw is None:
+            return None
+        return self._decode_value(definition, raw)
+
+    async def _async_read_register_raw(self, definition: RegisterDefinition) -> int | None:
+        """Read the raw word of a single register with pymodbus 3.x."""
+        try:
+            registers = await self._async_read_raw_registers(definition.address, 1)
             
-            if not result or (hasattr(result, "isError") and result.isError()):
+            if registers is None:
                 _LOGGER.warning(
                     "Failed reading register %s (%s) at address %d",
                     definition.register_id,
@@ -273,21 +1253,6 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     definition.address,
                 )
                 return None
-
-            if hasattr(result, "registers"):
-                raw = result.registers[0]
-            elif isinstance(result, (list, tuple)):
-                raw = result[0]
-            else:
-                raw = result
-
-            # Convert to signed int16 if value is > 32767 (handle negative temperatures)
-            if raw > 32767:
-                raw = raw - 65536
-
-            if definition.optional and raw < 0:
-                # Device reports -1 when module isn't installed
-                return None
         except Exception as ex:
             _LOGGER.warning(
                 "Exception reading register %s (%s): %s",
@@ -297,7 +1262,20 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return None
 
-        return self._from_raw(definition, raw)
+        return registers[0]
+
+    @classmethod
+    def _decode_value(cls, definition: RegisterDefinition, raw: int) -> float | int | None:
+        """Convert a raw register word to a scaled value."""
+        # Convert to signed int16 if value is > 32767 (handle negative temperatures)
+        if raw > 32767:
+            raw = raw - 65536
+
+        if definition.optional and raw < 0:
+            # Device reports -1 when module isn't installed
+            return None
+
+        return cls._from_raw(definition, raw)
 
     @staticmethod
     def _from_raw(definition: RegisterDefinition, raw: int) -> float | int:
@@ -312,5 +1290,8 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Convert a scaled value back to raw register units."""
 
         if definition.scale == 1:
-            return int(value)
-        return int(round(float(value) / definition.scale))
+            raw = int(value)
+        else:
+            raw = int(round(float(value) / definition.scale))
+        # Encode negative values as unsigned 16-bit words
+        return raw & 0xFFFF
@@ -0,0 +1,152 @@
+"""Ventilation figures derived from each Parmair snapshot."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .const import (
+    DERIVED_MIN_TEMP_DIFFERENCE,
+    DERIVED_SMOOTHING_TIME,
+    DERIVED_TREND_TIME,
+    REG_DEFROST_STATE,
+    REG_EXHAUST_FAN_SPEED,
+    REG_EXHAUST_TEMP,
+    REG_FRESH_AIR_TEMP,
+    REG_SUPPLY_AFTER_RECOVERY_TEMP,
+    REG_SUPPLY_FAN_SPEED,
+    REG_SUPPLY_TEMP,
+)
+
+
+class Ewma:
+    """Exponentially weighted moving average over irregularly spaced samples.
+
+    The weight of each sample follows from the time since the previous one,
+    so a late or skipped poll doesn't distort the average.
+    """
+
+    def __init__(self, time_constant: float) -> None:
+        """Initialize the average with a time constant in seconds."""
+        self._time_constant = time_constant
+        self._last: float | None = None
+        self.value: float | None = None
+
+    def update(self, timestamp: float, sample: float) -> float:
+        """Add a sample taken at timestamp and return the new average."""
+        if self.value is None or self._last is None:
+            self.value = sample
+        else:
+            elapsed = max(0.0, timestamp - self._last)
+            alpha = 1.0 - math.exp(-elapsed / self._time_constant)
+            self.value += alpha * (sample - self.value)
+        self._last = timestamp
+        return self.value
+
+
+class Trend:
+    """Smoothed rate of change of a value, per hour."""
+
+    def __init__(self, time_constant: float) -> None:
+        """Initialize the trend with a smoothing time constant in seconds."""
+        self._rate = Ewma(time_constant)
+        self._previous: tuple[float, float] | None = None
+
+    @property
+    def value(self) -> float | None:
+        """Return the smoothed rate of change per hour."""
+        return self._rate.value
+
+    def update(self, timestamp: float, sample: float) -> None:
+        """Add a sample taken at timestamp."""
+        if self._previous is not None and timestamp > self._previous[0]:
+            last_time, last_sample = self._previous
+            rate = (sample - last_sample) / (timestamp - last_time) * 3600
+            self._rate.update(timestamp, rate)
+        self._previous = (timestamp, sample)
+
+
+class DefrostTracker:
+    """Count defrost cycles and time the last one from the defrost state flag."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._active: bool | None = None
+        self._started: float | None = None
+        self.cycles = 0
+        self.last_duration: float | None = None
+
+    def update(self, timestamp: float, state: int) -> None:
+        """Add a defrost state sample taken at timestamp."""
+        active = bool(state)
+        if self._active is False and active:
+            self.cycles += 1
+            self._started = timestamp
+        elif self._active and not active and self._started is not None:
+            self.last_duration = timestamp - self._started
+        # A cycle already running at startup has no known start
+        self._active = active
+
+
+class VentilationMetrics:
+    """Figures users would otherwise build with template sensors.
+
+    Updated once per coordinator snapshot in a single pass, so every figure
+    comes from one consistent set of readings. All state is a handful of
+    floats per figure, however long the integration runs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._efficiency = Ewma(DERIVED_SMOOTHING_TIME)
+        self._recovery_rise = Ewma(DERIVED_SMOOTHING_TIME)
+        self._fan_imbalance = Ewma(DERIVED_SMOOTHING_TIME)
+        self._trends = {
+            REG_FRESH_AIR_TEMP: Trend(DERIVED_TREND_TIME),
+            REG_SUPPLY_TEMP: Trend(DERIVED_TREND_TIME),
+            REG_EXHAUST_TEMP: Trend(DERIVED_TREND_TIME),
+        }
+        self._defrost = DefrostTracker()
+
+    def update(self, timestamp: float, data: dict[str, Any]) -> None:
+        """Fold one snapshot taken at timestamp into the metrics."""
+        fresh = data.get(REG_FRESH_AIR_TEMP)
+        recovered = data.get(REG_SUPPLY_AFTER_RECOVERY_TEMP)
+        exhaust = data.get(REG_EXHAUST_TEMP)
+        if fresh is not None and recovered is not None:
+            self._recovery_rise.update(timestamp, recovered - fresh)
+            # Efficiency is meaningless when indoor and outdoor are close
+            if exhaust is not None and abs(exhaust - fresh) >= DERIVED_MIN_TEMP_DIFFERENCE:
+                self._efficiency.update(
+                    timestamp, (recovered - fresh) / (exhaust - fresh) * 100
+                )
+
+        supply_fan = data.get(REG_SUPPLY_FAN_SPEED)
+        exhaust_fan = data.get(REG_EXHAUST_FAN_SPEED)
+        if supply_fan is not None and exhaust_fan is not None:
+            self._fan_imbalance.update(timestamp, supply_fan - exhaust_fan)
+
+        for key, trend in self._trends.items():
+            if (value := data.get(key)) is not None:
+                trend.update(timestamp, value)
+
+        if (defrost := data.get(REG_DEFROST_STATE)) is not None:
+            self._defrost.update(timestamp, defrost)
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the current value of every figure."""
+        return {
+            "temperature_efficiency": _round(self._efficiency.value, 1),
+            "recovery_temperature_rise": _round(self._recovery_rise.value, 1),
+            "fan_imbalance": _round(self._fan_imbalance.value, 1),
+            "fresh_air_temp_trend": _round(self._trends[REG_FRESH_AIR_TEMP].value, 2),
+            "supply_temp_trend": _round(self._trends[REG_SUPPLY_TEMP].value, 2),
+            "exhaust_temp_trend": _round(self._trends[REG_EXHAUST_TEMP].value, 2),
+            "defrost_cycles": self._defrost.cycles,
+            "last_defrost_duration": _round(self._defrost.last_duration, 0),
+        }
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """Round a figure that may not be known yet."""
+    return None if value is None else round(value, digits)
@@ -0,0 +1,28 @@
+"""Diagnostics support for the Parmair integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_SERIAL_PORT, DOMAIN
+from .coordinator import ParmairCoordinator
+
+TO_REDACT = {CONF_HOST, CONF_PORT, CONF_SERIAL_PORT}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ParmairCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "last_update_success": coordinator.last_update_success,
+        "modbus": coordinator.diagnostics_data(),
+        "data": coordinator.data,
+    }
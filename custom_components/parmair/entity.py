@@ -0,0 +1,24 @@
+"""Base entity for the Parmair integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ParmairCoordinator
+
+
+class ParmairEntity(CoordinatorEntity[ParmairCoordinator]):
+    """Entity backed by the coordinator's polled data.
+
+    While the coordinator only has values restored from the last snapshot,
+    every entity carries a "stale" attribute; it disappears with the first
+    successful poll.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Flag values not yet confirmed by a poll."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return {}
@@ -8,7 +8,6 @@ from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.percentage import (
     ordered_list_item_to_percentage,
     percentage_to_ordered_list_item,
@@ -27,6 +26,7 @@ from .const import (
     REG_POWER,
 )
 from .coordinator import ParmairCoordinator
+from .entity import ParmairEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,7 +49,7 @@ async def async_setup_entry(
     async_add_entities([ParmairFan(coordinator, entry)])
 
 
-class ParmairFan(CoordinatorEntity[ParmairCoordinator], FanEntity):
+class ParmairFan(ParmairEntity, FanEntity):
     """Representation of a Parmair ventilation system as a fan."""
 
     _attr_has_entity_name = True
@@ -63,7 +63,7 @@ class ParmairFan(CoordinatorEntity[ParmairCoordinator], FanEntity):
 
     def __init__(self, coordinator: ParmairCoordinator, entry: ConfigEntry) -> None:
         """Initialize the fan entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((REG_POWER, REG_CONTROL_STATE)))
         self._attr_unique_id = f"{entry.entry_id}_fan"
         self._attr_device_info = coordinator.device_info
 
@@ -119,7 +119,6 @@ class ParmairFan(CoordinatorEntity[ParmairCoordinator], FanEntity):
         # First ensure power is on
         if self.coordinator.data.get("power") != POWER_RUNNING:
             await self.coordinator.async_write_register(REG_POWER, POWER_RUNNING)
-            await self.coordinator.async_request_refresh()
         
         # Then set mode
         if preset_mode:
@@ -129,12 +128,10 @@ class ParmairFan(CoordinatorEntity[ParmairCoordinator], FanEntity):
         else:
             # Default to HOME mode
             await self.coordinator.async_write_register(REG_CONTROL_STATE, MODE_HOME)
-            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan."""
-        if await self.coordinator.async_write_register(REG_CONTROL_STATE, MODE_STOP):
-            await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_register(REG_CONTROL_STATE, MODE_STOP)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
@@ -156,14 +153,14 @@ class ParmairFan(CoordinatorEntity[ParmairCoordinator], FanEntity):
         
         if preset_mode in mode_map:
             mode_value = mode_map[preset_mode]
-            if await self.coordinator.async_write_register(REG_CONTROL_STATE, mode_value):
-                await self.coordinator.async_request_refresh()
+            await self.coordinator.async_write_register(REG_CONTROL_STATE, mode_value)
 
     @property
     def extra_state_attributes(self) -> dict[str, object]:
         """Expose high-level metadata for diagnostics."""
 
         return {
+            **super().extra_state_attributes,
             "parmair_power_register": self.coordinator.get_register_definition(REG_POWER).label,
             "parmair_control_register": self.coordinator.get_register_definition(REG_CONTROL_STATE).label,
         }
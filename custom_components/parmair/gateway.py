@@ -0,0 +1,177 @@
+"""Modbus sessions shared by every Parmair unit behind one endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_IO_MODE,
+    CONF_TRANSPORT,
+    DEFAULT_IO_MODE,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+)
+from .scheduler import RequestScheduler
+from .transport import ParmairTransport, create_transport, endpoint_name
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data key for the gateways in use, by host:port or serial port
+_GATEWAYS_KEY = f"{DOMAIN}_gateways"
+
+
+class ModbusGateway:
+    """One Modbus endpoint and the session all units behind it share.
+
+    Several MAC units behind a Modbus TCP gateway or on one RS-485 bus get a
+    single transport and a single request scheduler, so their requests take
+    turns on one session instead of interleaving on the gateway. Units talk
+    to it through a UnitTransport bound to their unit ID.
+    """
+
+    def __init__(
+        self, endpoint: str, transport: ParmairTransport, settings: tuple[str, str]
+    ) -> None:
+        """Initialize the gateway."""
+        self.endpoint = endpoint
+        self.transport = transport
+        # Transport type and I/O mode the session was opened with
+        self.settings = settings
+        self.scheduler = RequestScheduler()
+        # Config entries and flows currently using the gateway
+        self.users = 0
+        self._close_handle: asyncio.TimerHandle | None = None
+
+    def unit(self, unit_id: int) -> UnitTransport:
+        """Return a transport for one unit behind the gateway."""
+        return UnitTransport(self, unit_id)
+
+
+class UnitTransport:
+    """Transport for one unit, sending its requests through a shared gateway.
+
+    Offers the ParmairTransport interface with the unit ID filled in.
+    """
+
+    def __init__(self, gateway: ModbusGateway, unit_id: int) -> None:
+        """Initialize the transport."""
+        self.host = gateway.transport.host
+        self.port = gateway.transport.port
+        self.baudrate = gateway.transport.baudrate
+        self.unit_id = unit_id
+        self._gateway = gateway
+
+    @property
+    def min_request_gap(self) -> float:
+        """Return the shortest pause allowed between requests in seconds."""
+        return self._gateway.transport.min_request_gap
+
+    def wire_time(self, function_code: int, count: int) -> float:
+        """Return the time a request and its response spend on the bus in seconds."""
+        return self._gateway.transport.wire_time(function_code, count)
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the shared session is open."""
+        return self._gateway.transport.connected
+
+    async def async_connect(self) -> bool:
+        """Open the shared session unless another unit already did."""
+        if self._gateway.transport.connected:
+            return True
+        return await self._gateway.transport.async_connect()
+
+    async def async_close(self, force: bool = False) -> None:
+        """Close the session, unless other units still share it.
+
+        With force the session is closed regardless, e.g. when it is broken
+        for everyone.
+        """
+        if force or self._gateway.users <= 1:
+            await self._gateway.transport.async_close()
+
+    async def async_read_holding_registers(self, address: int, count: int) -> Any:
+        """Read a run of holding registers from this unit."""
+        return await self._gateway.transport.async_read_holding_registers(
+            address, count, self.unit_id
+        )
+
+    async def async_write_register(self, address: int, value: int) -> Any:
+        """Write a single holding register on this unit."""
+        return await self._gateway.transport.async_write_register(
+            address, value, self.unit_id
+        )
+
+    async def async_write_registers(self, address: int, values: list[int]) -> Any:
+        """Write a run of holding registers (FC16) on this unit."""
+        return await self._gateway.transport.async_write_registers(
+            address, values, self.unit_id
+        )
+
+    async def async_drain(self) -> bool:
+        """Discard stale responses on the shared session."""
+        return await self._gateway.transport.async_drain()
+
+
+@callback
+def async_acquire_gateway(hass: HomeAssistant, data: dict[str, Any]) -> ModbusGateway:
+    """Return the shared gateway for a config entry's endpoint, creating it if needed."""
+    gateways: dict[str, ModbusGateway] = hass.data.setdefault(_GATEWAYS_KEY, {})
+    endpoint = endpoint_name(data)
+    settings = (
+        data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+        data.get(CONF_IO_MODE, DEFAULT_IO_MODE),
+    )
+
+    if (gateway := gateways.get(endpoint)) is None:
+        gateway = gateways[endpoint] = ModbusGateway(
+            endpoint, create_transport(hass, data), settings
+        )
+    elif gateway.settings != settings:
+        _LOGGER.warning(
+            "Units on %s use different transport settings; sharing the existing "
+            "%s session (%s I/O)",
+            endpoint,
+            *gateway.settings,
+        )
+
+    if gateway._close_handle is not None:
+        gateway._close_handle.cancel()
+        gateway._close_handle = None
+    gateway.users += 1
+    return gateway
+
+
+@callback
+def async_release_gateway(
+    hass: HomeAssistant, gateway: ModbusGateway, linger: float = 0
+) -> None:
+    """Stop using a gateway, closing its session once nobody uses it.
+
+    With linger the session is kept open that many seconds for the next
+    user, so the config flow can hand its detection session to the new
+    entry's coordinator.
+    """
+    gateway.users -= 1
+    if gateway.users > 0:
+        return
+
+    @callback
+    def _async_close() -> None:
+        """Close the session and forget the gateway if it is still unused."""
+        gateway._close_handle = None
+        if gateway.users > 0:
+            return
+        gateways: dict[str, ModbusGateway] = hass.data.get(_GATEWAYS_KEY, {})
+        if gateways.get(gateway.endpoint) is gateway:
+            del gateways[gateway.endpoint]
+        hass.async_create_task(gateway.transport.async_close())
+
+    if linger:
+        gateway._close_handle = hass.loop.call_later(linger, _async_close)
+    else:
+        _async_close()
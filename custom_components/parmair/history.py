@@ -0,0 +1,168 @@
+"""Compact in-memory history of polled register values for the Parmair integration."""
+
+from __future__ import annotations
+
+from array import array
+import time
+from typing import Any, Iterable, Iterator
+
+from .const import RegisterDefinition
+
+# Raw word stored for a sample without a reading; the device never reports it
+MISSING = -32768
+
+
+class RegisterHistory:
+    """Fixed-size ring buffer of polled register values.
+
+    Each polled address gets one array('h') column of raw signed register
+    words and all columns share one timestamp column, so a sample costs two
+    bytes per register plus eight for its time. Keys aliasing one address
+    share its column. Columns are allocated up front and overwritten in
+    place, so memory never grows.
+    """
+
+    def __init__(self, definitions: Iterable[RegisterDefinition], capacity: int) -> None:
+        """Initialize the buffer with capacity samples for the given registers."""
+        self._definitions: dict[str, RegisterDefinition] = {}
+        self._columns: dict[int, array] = {}
+        for definition in definitions:
+            self._definitions[definition.key] = definition
+            if definition.address not in self._columns:
+                self._columns[definition.address] = array("h", [MISSING]) * capacity
+        self._times = array("d", [0.0]) * capacity
+        self._capacity = capacity
+        self._next = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of samples kept."""
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        """Return the number of samples recorded so far, up to the capacity."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the sample columns in bytes."""
+        return self._times.itemsize * len(self._times) + sum(
+            column.itemsize * len(column) for column in self._columns.values()
+        )
+
+    @property
+    def span(self) -> float:
+        """Return the seconds between the oldest and the newest sample."""
+        if self._size < 2:
+            return 0.0
+        return self._times[self._index(0)] - self._times[self._index(self._size - 1)]
+
+    def record(self, timestamp: float, data: dict[str, Any]) -> None:
+        """Record one snapshot of decoded values taken at timestamp.
+
+        Registers missing from data get no reading in this sample.
+        """
+        index = self._next
+        self._times[index] = timestamp
+        written: set[int] = set()
+        for key, definition in self._definitions.items():
+            address = definition.address
+            if address in written:
+                continue
+            value = data.get(key)
+            if value is None:
+                # An alias further on may still carry the reading
+                self._columns[address][index] = MISSING
+                continue
+            self._columns[address][index] = _to_word(definition, value)
+            written.add(address)
+        self._next = (index + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+    def values(
+        self, key: str, window: float, now: float | None = None
+    ) -> list[tuple[float, float | int]]:
+        """Return the (timestamp, value) samples of the last window seconds, oldest first."""
+        definition = self._definitions[key]
+        samples = [
+            (timestamp, _from_word(definition, raw))
+            for timestamp, raw in self._window(definition.address, window, now)
+        ]
+        samples.reverse()
+        return samples
+
+    def summary(
+        self, key: str, window: float, now: float | None = None
+    ) -> dict[str, float | int | None]:
+        """Return count, min, max, mean and slope (per hour) over the last window seconds.
+
+        Works on the raw words and scales the results once, so a query over
+        a day of samples doesn't build a list of floats.
+        """
+        definition = self._definitions[key]
+        count = 0
+        low = high = None
+        sum_t = sum_v = sum_tt = sum_tv = 0.0
+        origin: float | None = None
+        for timestamp, raw in self._window(definition.address, window, now):
+            if origin is None:
+                origin = timestamp
+            offset = timestamp - origin
+            count += 1
+            low = raw if low is None or raw < low else low
+            high = raw if high is None or raw > high else high
+            sum_t += offset
+            sum_v += raw
+            sum_tt += offset * offset
+            sum_tv += offset * raw
+
+        if not count:
+            return {"count": 0, "min": None, "max": None, "mean": None, "slope_per_hour": None}
+
+        slope = None
+        denominator = count * sum_tt - sum_t * sum_t
+        if count > 1 and denominator > 0:
+            slope = (count * sum_tv - sum_t * sum_v) / denominator * 3600 * definition.scale
+        return {
+            "count": count,
+            "min": _from_word(definition, low),
+            "max": _from_word(definition, high),
+            "mean": sum_v / count * definition.scale,
+            "slope_per_hour": slope,
+        }
+
+    def _index(self, age: int) -> int:
+        """Return the slot of the sample age samples before the newest."""
+        return (self._next - 1 - age) % self._capacity
+
+    def _window(
+        self, address: int, window: float, now: float | None
+    ) -> Iterator[tuple[float, int]]:
+        """Yield (timestamp, raw) samples of the last window seconds, newest first."""
+        column = self._columns[address]
+        since = (time.time() if now is None else now) - window
+        for age in range(self._size):
+            index = self._index(age)
+            timestamp = self._times[index]
+            if timestamp < since:
+                return
+            if (raw := column[index]) != MISSING:
+                yield timestamp, raw
+
+
+def _to_word(definition: RegisterDefinition, value: float | int) -> int:
+    """Convert a decoded value back to its signed register word."""
+    if definition.scale == 1:
+        raw = int(value)
+    else:
+        raw = int(round(float(value) / definition.scale))
+    return max(MISSING + 1, min(32767, raw))
+
+
+def _from_word(definition: RegisterDefinition, raw: int) -> float | int:
+    """Convert a signed register word to engineering units."""
+    if definition.scale == 1:
+        return raw
+    return raw * definition.scale
@@ -0,0 +1,182 @@
+"""Rolling Modbus health metrics for the Parmair integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Callable, Iterable
+
+
+def _percentile(samples: Iterable[float], percentile: float) -> float | None:
+    """Return a nearest-rank percentile, or None without samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(samples: deque[float]) -> dict[str, float | None]:
+    """Summarise latency samples in milliseconds."""
+    if not samples:
+        return {"last_ms": None, "p50_ms": None, "p95_ms": None, "max_ms": None}
+    return {
+        "last_ms": round(samples[-1] * 1000, 1),
+        "p50_ms": round(_percentile(samples, 50) * 1000, 1),
+        "p95_ms": round(_percentile(samples, 95) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+class ModbusMetrics:
+    """Keep rolling figures on polls, requests and errors for one device.
+
+    Timings are kept in fixed-size windows so memory stays constant; counters
+    run for the lifetime of the config entry.
+    """
+
+    def __init__(self, window: int) -> None:
+        """Initialize the metrics."""
+        self._window = window
+        self.poll_durations: deque[float] = deque(maxlen=window)
+        self.poll_requests: deque[int] = deque(maxlen=window)
+        self.request_latencies: deque[float] = deque(maxlen=window)
+        self.write_latencies: deque[float] = deque(maxlen=window)
+        self.address_latencies: dict[int, deque[float]] = {}
+        self.requests = 0
+        self.polls = 0
+        self.failed_polls = 0
+        self.transaction_mismatches = 0
+        self.timeouts = 0
+        self.connection_errors = 0
+        self.reconnects = 0
+
+    def record_request(self, address: int, latency: float) -> None:
+        """Record a request answered after latency seconds."""
+        self.requests += 1
+        self.request_latencies.append(latency)
+        if (samples := self.address_latencies.get(address)) is None:
+            samples = self.address_latencies[address] = deque(maxlen=self._window)
+        samples.append(latency)
+
+    def record_poll(self, duration: float, requests: int) -> None:
+        """Record a completed poll."""
+        self.polls += 1
+        self.poll_durations.append(duration)
+        self.poll_requests.append(requests)
+
+    def record_failed_poll(self) -> None:
+        """Record a poll that raised."""
+        self.failed_polls += 1
+
+    def record_write(self, latency: float) -> None:
+        """Record the time from a write command to its confirmed state."""
+        self.write_latencies.append(latency)
+
+    def record_transaction_mismatch(self) -> None:
+        """Record a response carrying the wrong transaction ID."""
+        self.transaction_mismatches += 1
+
+    def record_timeout(self) -> None:
+        """Record a request that got no usable response."""
+        self.timeouts += 1
+
+    def record_connection_error(self) -> None:
+        """Record a request that failed because the session broke."""
+        self.connection_errors += 1
+
+    def record_reconnect(self) -> None:
+        """Record a session reopened after it was lost to an error."""
+        self.reconnects += 1
+
+    def register_latencies(
+        self, name_for: Callable[[int], str]
+    ) -> dict[str, dict[str, float | None]]:
+        """Return latency percentiles per request start address, slowest first."""
+        summaries = {
+            name_for(address): _summary(samples)
+            for address, samples in self.address_latencies.items()
+            if samples
+        }
+        return dict(
+            sorted(summaries.items(), key=lambda item: item[1]["p95_ms"] or 0, reverse=True)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot of every metric."""
+        return {
+            "polls": self.polls,
+            "failed_polls": self.failed_polls,
+            "requests": self.requests,
+            "requests_per_poll": self.poll_requests[-1] if self.poll_requests else None,
+            "poll_duration": _summary(self.poll_durations),
+            "request_latency": _summary(self.request_latencies),
+            "write_latency": _summary(self.write_latencies),
+            "transaction_mismatches": self.transaction_mismatches,
+            "timeouts": self.timeouts,
+            "connection_errors": self.connection_errors,
+            "reconnects": self.reconnects,
+        }
+
+
+class RequestLog:
+    """Fixed-size ring buffer of the most recent Modbus requests.
+
+    Slots are allocated up front and overwritten in place, so recording costs
+    one tuple per request and memory never grows; it is always on.
+    """
+
+    FIELDS = (
+        "time",
+        "function_code",
+        "address",
+        "count",
+        "priority",
+        "transaction_id",
+        "latency_ms",
+        "outcome",
+        "error",
+    )
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer with size slots."""
+        self._slots: list[tuple | None] = [None] * size
+        self._next = 0
+        self.total = 0
+
+    def record(
+        self,
+        timestamp: float,
+        function_code: int,
+        address: int,
+        count: int,
+        priority: int,
+        transaction_id: int | None,
+        latency: float,
+        outcome: str,
+        error: str | None = None,
+    ) -> None:
+        """Record one request and its outcome."""
+        self._slots[self._next] = (
+            timestamp,
+            function_code,
+            address,
+            count,
+            priority,
+            transaction_id,
+            latency,
+            outcome,
+            error,
+        )
+        self._next = (self._next + 1) % len(self._slots)
+        self.total += 1
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the recorded requests, oldest first."""
+        ordered = self._slots[self._next:] + self._slots[:self._next]
+        entries = []
+        for entry in ordered:
+            if entry is not None:
+                item = dict(zip(self.FIELDS, entry))
+                item["latency_ms"] = round(item["latency_ms"] * 1000, 1)
+                entries.append(item)
+        return entries
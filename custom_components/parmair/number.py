@@ -9,7 +9,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -25,6 +24,7 @@ from .const import (
     REG_SUPPLY_TEMP_SETPOINT,
 )
 from .coordinator import ParmairCoordinator
+from .entity import ParmairEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ParmairNumberEntity(CoordinatorEntity[ParmairCoordinator], NumberEntity):
+class ParmairNumberEntity(ParmairEntity, NumberEntity):
     """Base class for Parmair number entities."""
 
     _attr_has_entity_name = True
@@ -78,7 +78,7 @@ class ParmairNumberEntity(CoordinatorEntity[ParmairCoordinator], NumberEntity):
         name: str,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((data_key,)))
         self._data_key = data_key
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{data_key}"
@@ -93,7 +93,6 @@ class ParmairNumberEntity(CoordinatorEntity[ParmairCoordinator], NumberEntity):
         """Set new value."""
         try:
             await self.coordinator.async_write_register(self._data_key, int(value))
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to set %s to %s: %s", self._data_key, value, ex)
             raise
@@ -119,9 +118,10 @@ class ParmairManualSpeedNumber(ParmairNumberEntity):
         super().__init__(coordinator, entry, data_key, name)
 
     @property
-    def extra_state_attributes(self) -> dict[str, str]:
+    def extra_state_attributes(self) -> dict[str, object]:
         """Return speed mapping information."""
         return {
+            **super().extra_state_attributes,
             "speed_map": "0=Auto, 1=Stop, 2=Speed 1, 3=Speed 2, 4=Speed 3, 5=Speed 4, 6=Speed 5"
         }
 
@@ -206,7 +206,7 @@ class ParmairFilterIntervalNumber(ParmairNumberEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        attrs = super().extra_state_attributes or {}
+        attrs = super().extra_state_attributes
         value = self.native_value
         if value is not None:
             interval_map = {0: "3 months", 1: "4 months", 2: "6 months"}
@@ -235,3 +235,7 @@ class ParmairTimerNumber(ParmairNumberEntity):
         """Initialize timer number."""
         super().__init__(coordinator, entry, data_key, name)
         self._attr_icon = icon
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set new value, coalescing rapid slider changes into one write."""
+        self.coordinator.async_write_register_debounced(self._data_key, int(value))
@@ -0,0 +1,82 @@
+"""Adaptive request pacing for the Parmair integration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from .const import (
+    PACING_CONNECT_SETTLE_FACTOR,
+    PACING_DECREASE_STEP,
+    PACING_INCREASE_FACTOR,
+    PACING_MAX_DELAY,
+    PACING_MIN_DELAY,
+    PACING_SLOW_RESPONSE_FACTOR,
+    PACING_SUCCESS_WINDOW,
+)
+
+
+class AdaptivePacer:
+    """Learn the shortest safe delay between Modbus requests for one device.
+
+    Works like AIMD congestion control: every run of clean responses shaves a
+    fixed step off the delay, while a transaction ID mismatch or timeout
+    multiplies it. Responses much slower than usual reset the run so the
+    delay doesn't shrink while the device is struggling.
+    """
+
+    def __init__(self, delay: float, min_delay: float = PACING_MIN_DELAY) -> None:
+        """Initialize the pacer with a starting and a minimum delay in seconds."""
+        self._min_delay = min_delay
+        self._delay = min(PACING_MAX_DELAY, max(min_delay, delay))
+        self._latency: float | None = None
+        self._streak = 0
+        self._ready_at = 0.0
+
+    @property
+    def delay(self) -> float:
+        """Return the current delay between requests in seconds."""
+        return self._delay
+
+    @property
+    def min_delay(self) -> float:
+        """Return the shortest delay the pacer may learn in seconds."""
+        return self._min_delay
+
+    @property
+    def latency(self) -> float | None:
+        """Return the smoothed response latency in seconds."""
+        return self._latency
+
+    async def async_wait(self) -> None:
+        """Sleep until the device is ready for the next request."""
+        remaining = self._ready_at - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def connected(self) -> None:
+        """Give a freshly opened session extra time to settle."""
+        self._ready_at = time.monotonic() + self._delay * PACING_CONNECT_SETTLE_FACTOR
+
+    def record_success(self, latency: float) -> None:
+        """Record a response that arrived in step with its request."""
+        if self._latency is None:
+            self._latency = latency
+            self._streak += 1
+        elif latency > self._latency * PACING_SLOW_RESPONSE_FACTOR:
+            self._streak = 0
+        else:
+            self._streak += 1
+            self._latency = 0.8 * self._latency + 0.2 * latency
+
+        if self._streak >= PACING_SUCCESS_WINDOW:
+            self._streak = 0
+            self._delay = max(self._min_delay, self._delay - PACING_DECREASE_STEP)
+
+        self._ready_at = time.monotonic() + self._delay
+
+    def record_failure(self) -> None:
+        """Record a transaction ID mismatch or timeout."""
+        self._streak = 0
+        self._delay = min(PACING_MAX_DELAY, self._delay * PACING_INCREASE_FACTOR)
+        self._ready_at = time.monotonic() + self._delay
@@ -0,0 +1,151 @@
+"""Modbus read planning for the Parmair integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from .const import RegisterDefinition
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    """A contiguous range of holding registers fetched with a single request."""
+
+    address: int
+    count: int
+    definitions: tuple[RegisterDefinition, ...]
+
+    @property
+    def end(self) -> int:
+        """Return the first address after this block."""
+
+        return self.address + self.count
+
+    def by_address(self) -> Iterator[tuple[int, tuple[RegisterDefinition, ...]]]:
+        """Yield each physical address in the block with the definitions aliasing it."""
+
+        grouped: dict[int, list[RegisterDefinition]] = {}
+        for definition in self.definitions:
+            grouped.setdefault(definition.address, []).append(definition)
+        for address, definitions in grouped.items():
+            yield address, tuple(definitions)
+
+    def split(self, registers: list[int]) -> Iterator[tuple[RegisterDefinition, int]]:
+        """Yield each definition with its raw value taken from a block response."""
+
+        if len(registers) < self.count:
+            raise ValueError(
+                f"Block at {self.address} expected {self.count} registers, got {len(registers)}"
+            )
+        for definition in self.definitions:
+            yield definition, registers[definition.address - self.address]
+
+
+@dataclass(frozen=True)
+class WriteBlock:
+    """A contiguous range of holding registers written with a single request."""
+
+    address: int
+    values: tuple[int, ...]
+    definitions: tuple[RegisterDefinition, ...]
+
+    @property
+    def count(self) -> int:
+        """Return the number of registers written."""
+
+        return len(self.values)
+
+
+def build_read_plan(
+    definitions: Iterable[RegisterDefinition],
+    max_gap: int,
+    max_block_size: int,
+) -> tuple[ReadBlock, ...]:
+    """Group register definitions into the fewest contiguous block reads.
+
+    Args:
+        definitions: Registers that need to be read
+        max_gap: Largest run of unused registers allowed inside one block
+        max_block_size: Largest number of registers fetched by one request
+
+    Returns:
+        Read blocks ordered by start address
+    """
+    max_block_size = max(1, max_block_size)
+    max_gap = max(0, max_gap)
+
+    blocks: list[ReadBlock] = []
+    current: list[RegisterDefinition] = []
+    start = end = 0
+
+    for definition in sorted(definitions, key=lambda item: item.address):
+        address = definition.address
+        if current and (
+            address - end > max_gap or address + 1 - start > max_block_size
+        ):
+            blocks.append(ReadBlock(start, end - start, tuple(current)))
+            current = []
+        if not current:
+            start = address
+        current.append(definition)
+        end = address + 1
+
+    if current:
+        blocks.append(ReadBlock(start, end - start, tuple(current)))
+
+    return tuple(blocks)
+
+
+def build_write_plan(
+    writes: Iterable[tuple[RegisterDefinition, int]],
+    max_block_size: int,
+) -> tuple[WriteBlock, ...]:
+    """Group raw register writes into the fewest contiguous block writes.
+
+    Unlike reads, writes cannot span gaps, so only registers at directly
+    adjacent addresses share a block. Keys aliasing the same address collapse
+    into one register; they must agree on the value.
+
+    Args:
+        writes: Register definitions with the raw value to write
+        max_block_size: Largest number of registers written by one request
+
+    Returns:
+        Write blocks ordered by start address
+    """
+    max_block_size = max(1, max_block_size)
+
+    by_address: dict[int, tuple[int, list[RegisterDefinition]]] = {}
+    for definition, raw in writes:
+        if definition.address in by_address:
+            existing, definitions = by_address[definition.address]
+            if existing != raw:
+                raise ValueError(
+                    f"Conflicting values for address {definition.address}: {existing} and {raw}"
+                )
+            definitions.append(definition)
+        else:
+            by_address[definition.address] = (raw, [definition])
+
+    blocks: list[WriteBlock] = []
+    values: list[int] = []
+    definitions: list[RegisterDefinition] = []
+    start = 0
+
+    for address in sorted(by_address):
+        raw, address_definitions = by_address[address]
+        if values and (address != start + len(values) or len(values) >= max_block_size):
+            blocks.append(WriteBlock(start, tuple(values), tuple(definitions)))
+            values = []
+            definitions = []
+        if not values:
+            start = address
+        values.append(raw)
+        definitions.extend(address_definitions)
+
+    if values:
+        blocks.append(WriteBlock(start, tuple(values), tuple(definitions)))
+
+    return tuple(blocks)
@@ -0,0 +1,82 @@
+"""Prioritised access to the Modbus session for the Parmair integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+
+class RequestScheduler:
+    """Grant exclusive use of the Modbus session one request at a time.
+
+    Waiters are served by priority (lower first), so a write queued during a
+    poll goes out at the next request boundary while the poll simply
+    continues with its next block afterwards. Within a priority each unit
+    sharing the session has its own queue and units take turns, so one
+    unit's poll can't starve the others on a shared gateway.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._busy = False
+        # Priority -> unit -> waiters in arrival order; dict order is the
+        # round-robin order of units
+        self._queues: dict[int, dict[Hashable, deque[asyncio.Future[None]]]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Return the number of requests waiting for the session."""
+        return sum(
+            1
+            for units in self._queues.values()
+            for waiters in units.values()
+            for future in waiters
+            if not future.done()
+        )
+
+    @asynccontextmanager
+    async def async_slot(
+        self, priority: int, unit: Hashable = None
+    ) -> AsyncIterator[None]:
+        """Hold the session for one request on behalf of a unit."""
+        await self._async_acquire(priority, unit)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int, unit: Hashable) -> None:
+        """Wait until the session is free for a request of this priority."""
+        if not self._busy and not self._queues:
+            self._busy = True
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(priority, {}).setdefault(unit, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we were cancelled, pass it on
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the session to the next waiter, or mark it free."""
+        while self._queues:
+            priority = min(self._queues)
+            units = self._queues[priority]
+            unit = next(iter(units))
+            waiters = units.pop(unit)
+            future = waiters.popleft()
+            if waiters:
+                # Back of the line for this unit's next request
+                units[unit] = waiters
+            if not units:
+                del self._queues[priority]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
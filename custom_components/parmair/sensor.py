@@ -30,11 +30,18 @@ from .const import (
     HEATER_TYPE_ELECTRIC_V2,
     HEATER_TYPE_WATER_V2,
     HEATER_TYPE_NONE_V2,
+    REG_CO2_EXHAUST,
+    REG_HUMIDITY,
+    REG_HUMIDITY_24H_AVG,
 )
 from .coordinator import ParmairCoordinator
+from .entity import ParmairEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Unit of the derived temperature trend sensors
+TEMPERATURE_TREND_UNIT = "°C/h"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -82,30 +89,103 @@ async def async_setup_entry(
         ParmairPercentageSensor(coordinator, entry, "supply_fan_speed", "Supply Fan Speed"),
         ParmairPercentageSensor(coordinator, entry, "exhaust_fan_speed", "Exhaust Fan Speed"),
         
-        # Optional sensors (will show unavailable if hardware not present)
-        ParmairHumiditySensor(coordinator, entry, "humidity", "Humidity"),
-        ParmairHumidity24hAvgSensor(coordinator, entry, "humidity_24h_avg", "Humidity 24h Average"),
-        
         # Filter change date sensor
         ParmairFilterChangeDateSensor(coordinator, entry),
+        
+        # Derived ventilation figures
+        ParmairVentilationSensor(
+            coordinator, entry, "temperature_efficiency", "Temperature Efficiency",
+            "mdi:heat-wave", PERCENTAGE,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "recovery_temperature_rise", "Heat Recovery Temperature Rise",
+            "mdi:thermometer-plus", UnitOfTemperature.KELVIN,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "fan_imbalance", "Supply/Exhaust Fan Imbalance",
+            "mdi:scale-unbalanced", PERCENTAGE,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "fresh_air_temp_trend", "Fresh Air Temperature Trend",
+            "mdi:chart-line", TEMPERATURE_TREND_UNIT,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "supply_temp_trend", "Supply Air Temperature Trend",
+            "mdi:chart-line", TEMPERATURE_TREND_UNIT,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "exhaust_temp_trend", "Exhaust Air Temperature Trend",
+            "mdi:chart-line", TEMPERATURE_TREND_UNIT,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "defrost_cycles", "Defrost Cycles",
+            "mdi:snowflake-melt", total=True,
+        ),
+        ParmairVentilationSensor(
+            coordinator, entry, "last_defrost_duration", "Last Defrost Duration",
+            "mdi:snowflake-thermometer", UnitOfTime.SECONDS,
+        ),
+        
+        # Modbus health metrics
+        ParmairMetricSensor(
+            coordinator, entry, "poll_duration", "Modbus Poll Duration",
+            "mdi:timer-outline", UnitOfTime.MILLISECONDS, "last_ms",
+        ),
+        ParmairMetricSensor(
+            coordinator, entry, "requests_per_poll", "Modbus Requests Per Poll",
+            "mdi:swap-horizontal",
+        ),
+        ParmairMetricSensor(
+            coordinator, entry, "request_latency", "Modbus Request Latency",
+            "mdi:timer-sand", UnitOfTime.MILLISECONDS, "p50_ms",
+        ),
+        ParmairMetricSensor(
+            coordinator, entry, "write_latency", "Modbus Write Latency",
+            "mdi:timer-edit-outline", UnitOfTime.MILLISECONDS, "last_ms",
+        ),
+        ParmairMetricSensor(
+            coordinator, entry, "transaction_mismatches", "Modbus Transaction ID Mismatches",
+            "mdi:swap-vertical-variant", total=True,
+        ),
+        ParmairMetricSensor(
+            coordinator, entry, "timeouts", "Modbus Timeouts",
+            "mdi:timer-alert-outline", total=True,
+        ),
+        ParmairMetricSensor(
+            coordinator, entry, "reconnects", "Modbus Reconnects",
+            "mdi:lan-disconnect", total=True,
+        ),
     ]
     
-    # Add exhaust CO2 sensor only for MAC 2 devices (v2.xx firmware)
-    # QE05_M = Combination sensor in exhaust duct (CO2 + humidity)
-    # Only in newest MAC 2 devices
-    try:
-        coordinator.get_register_definition("co2_exhaust")
-        entities.append(ParmairCO2Sensor(coordinator, entry, "co2_exhaust", "CO2 Exhaust Air"))
-    except (KeyError, ValueError):
-        # Register doesn't exist in v1.xx firmware - skip this sensor
-        pass
+    # Optional sensor modules, only when the firmware has the register and
+    # the probe found the module. QE05_M (exhaust CO2) is a combination
+    # sensor in the exhaust duct of the newest MAC 2 devices only.
+    optional_sensors = (
+        (ParmairHumiditySensor, REG_HUMIDITY, "Humidity"),
+        (ParmairHumidity24hAvgSensor, REG_HUMIDITY_24H_AVG, "Humidity 24h Average"),
+        (ParmairCO2Sensor, REG_CO2_EXHAUST, "CO2 Exhaust Air"),
+    )
+    for sensor_class, key, name in optional_sensors:
+        if key in coordinator.absent_modules:
+            # Module not fitted; an entity left from before the probe stays
+            # in the registry and shows as unavailable
+            continue
+        try:
+            entities.append(sensor_class(coordinator, entry, key, name))
+        except (KeyError, ValueError):
+            # Register doesn't exist in this firmware - skip this sensor
+            pass
     
     async_add_entities(entities)
 
 
-class ParmairRegisterEntity(CoordinatorEntity[ParmairCoordinator]):
+class ParmairRegisterEntity(ParmairEntity):
     """Base entity that exposes register metadata."""
 
+    # Other data keys the state depends on; the entity is only updated when
+    # one of these or its own key changes
+    _extra_data_keys: tuple[str, ...] = ()
+
     def __init__(
         self,
         coordinator: ParmairCoordinator,
@@ -113,7 +193,7 @@ class ParmairRegisterEntity(CoordinatorEntity[ParmairCoordinator]):
         data_key: str,
         name: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((data_key, *self._extra_data_keys)))
         self._data_key = data_key
         self._register = coordinator.get_register_definition(data_key)
         self._attr_name = name
@@ -126,6 +206,7 @@ class ParmairRegisterEntity(CoordinatorEntity[ParmairCoordinator]):
         """Expose register metadata for diagnostics."""
 
         return {
+            **super().extra_state_attributes,
             "parmair_register": self._register.label,
             "parmair_register_id": self._register.register_id,
             "parmair_register_address": self._register.address,
@@ -159,9 +240,14 @@ class ParmairTemperatureSensor(ParmairRegisterEntity, SensorEntity):
 
 
 class ParmairHumiditySensor(ParmairRegisterEntity, SensorEntity):
-    """Representation of a Parmair humidity sensor."""
+    """Representation of a Parmair humidity sensor.
+
+    Only created when the capability probe found the module, so the value
+    filter only has to cover transient readings.
+    """
 
     _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
 
@@ -185,27 +271,12 @@ class ParmairHumiditySensor(ParmairRegisterEntity, SensorEntity):
             return None
         return value
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class only if sensor is installed."""
-        value = self.coordinator.data.get(self._data_key)
-        if value in (0, 65535, None):
-            return None
-        return SensorDeviceClass.HUMIDITY
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class only if sensor is installed."""
-        value = self.coordinator.data.get(self._data_key)
-        if value in (0, 65535, None):
-            return None
-        return SensorStateClass.MEASUREMENT
-
 
 class ParmairHumidity24hAvgSensor(ParmairRegisterEntity, SensorEntity):
     """Representation of a Parmair 24-hour humidity average sensor."""
 
     _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
 
@@ -228,28 +299,12 @@ class ParmairHumidity24hAvgSensor(ParmairRegisterEntity, SensorEntity):
             return None
         return value
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class only if sensor has valid data."""
-        value = self.coordinator.data.get(self._data_key)
-        if value in (-1, None) or value < 0:
-            return None
-        return SensorDeviceClass.HUMIDITY
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class only if sensor has valid data."""
-        value = self.coordinator.data.get(self._data_key)
-        if value in (-1, None) or value < 0:
-            return None
-        return SensorStateClass.MEASUREMENT
-        return SensorDeviceClass.HUMIDITY
-
 
 class ParmairCO2Sensor(ParmairRegisterEntity, SensorEntity):
     """Representation of a Parmair CO2 sensor."""
 
     _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.CO2
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
 
@@ -273,22 +328,6 @@ class ParmairCO2Sensor(ParmairRegisterEntity, SensorEntity):
             return None
         return value
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class only if sensor is installed."""
-        value = self.coordinator.data.get(self._data_key)
-        if value in (0, 65535, None):
-            return None
-        return SensorDeviceClass.CO2
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class only if sensor is installed."""
-        value = self.coordinator.data.get(self._data_key)
-        if value in (0, 65535, None):
-            return None
-        return SensorStateClass.MEASUREMENT
-
 
 class ParmairStateSensor(ParmairRegisterEntity, SensorEntity):
     """Representation of a Parmair state sensor."""
@@ -444,9 +483,10 @@ class ParmairSpeedControlSensor(ParmairRegisterEntity, SensorEntity):
         return int(raw_value)
     
     @property
-    def extra_state_attributes(self) -> dict[str, str]:
+    def extra_state_attributes(self) -> dict[str, object]:
         """Return additional attributes."""
         return {
+            **super().extra_state_attributes,
             "description": "0=Stop, 1=Speed 1, 2=Speed 2, 3=Speed 3, 4=Speed 4, 5=Speed 5"
         }
 
@@ -511,6 +551,8 @@ class ParmairHeaterTypeSensor(ParmairRegisterEntity, SensorEntity):
         HEATER_TYPE_NONE_V2: "None"
     }
 
+    _extra_data_keys = ("software_version",)
+
     def __init__(
         self,
         coordinator: ParmairCoordinator,
@@ -566,7 +608,7 @@ class ParmairBinarySensor(ParmairRegisterEntity, SensorEntity):
         return self._state_map.get(raw_value, f"Unknown ({raw_value})")
 
 
-class ParmairFilterChangeDateSensor(CoordinatorEntity[ParmairCoordinator], SensorEntity):
+class ParmairFilterChangeDateSensor(ParmairEntity, SensorEntity):
     """Sensor showing when air filter was last changed."""
 
     _attr_has_entity_name = True
@@ -579,7 +621,17 @@ class ParmairFilterChangeDateSensor(CoordinatorEntity[ParmairCoordinator], Senso
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset((
+                "filter_day",
+                "filter_month",
+                "filter_year",
+                "filter_next_day",
+                "filter_next_month",
+                "filter_next_year",
+            )),
+        )
         self._attr_name = "Filter Last Changed"
         self._attr_unique_id = f"{entry.entry_id}_filter_last_changed"
         self._attr_device_info = coordinator.device_info
@@ -609,7 +661,7 @@ class ParmairFilterChangeDateSensor(CoordinatorEntity[ParmairCoordinator], Senso
         next_month = self.coordinator.data.get("filter_next_month")
         next_year = self.coordinator.data.get("filter_next_year")
         
-        attrs = {}
+        attrs = super().extra_state_attributes
         
         if next_day is not None and next_month is not None and next_year is not None:
             try:
@@ -619,3 +671,125 @@ class ParmairFilterChangeDateSensor(CoordinatorEntity[ParmairCoordinator], Senso
                 pass
         
         return attrs
+
+
+class ParmairVentilationSensor(ParmairEntity, SensorEntity):
+    """Sensor exposing one of the coordinator's derived ventilation figures.
+
+    The figures are computed once per poll from a single snapshot, so these
+    sensors replace template sensors over the raw temperatures and fan speeds.
+    Trends move even when the inputs don't, so they follow every update.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: ParmairCoordinator,
+        entry: ConfigEntry,
+        figure: str,
+        name: str,
+        icon: str,
+        unit: str | None = None,
+        total: bool = False,
+    ) -> None:
+        """Initialize the sensor.
+        
+        Args:
+            figure: Key in the coordinator's ventilation figures
+            total: True for counters that only grow
+        """
+        super().__init__(coordinator)
+        self._figure = figure
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = f"{entry.entry_id}_derived_{figure}"
+        self._attr_device_info = coordinator.device_info
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = (
+            SensorStateClass.TOTAL_INCREASING if total else SensorStateClass.MEASUREMENT
+        )
+        if unit == UnitOfTime.SECONDS:
+            self._attr_device_class = SensorDeviceClass.DURATION
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the figure."""
+        return self.coordinator.ventilation.as_dict()[self._figure]
+
+
+class ParmairMetricSensor(CoordinatorEntity[ParmairCoordinator], SensorEntity):
+    """Diagnostic sensor exposing one of the coordinator's Modbus health metrics."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Per-register latencies change every poll; keep them out of the recorder
+    _unrecorded_attributes = frozenset({"registers"})
+
+    def __init__(
+        self,
+        coordinator: ParmairCoordinator,
+        entry: ConfigEntry,
+        metric: str,
+        name: str,
+        icon: str,
+        unit: str | None = None,
+        statistic: str | None = None,
+        total: bool = False,
+    ) -> None:
+        """Initialize the sensor.
+        
+        Args:
+            metric: Key in the coordinator's metrics snapshot
+            statistic: Field to show for timing metrics (e.g. "p50_ms");
+                the other fields become attributes
+            total: True for counters that only grow
+        """
+        super().__init__(coordinator)
+        self._metric = metric
+        self._statistic = statistic
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = f"{entry.entry_id}_metric_{metric}"
+        self._attr_device_info = coordinator.device_info
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = (
+            SensorStateClass.TOTAL_INCREASING if total else SensorStateClass.MEASUREMENT
+        )
+        if unit == UnitOfTime.MILLISECONDS:
+            self._attr_device_class = SensorDeviceClass.DURATION
+
+    @property
+    def available(self) -> bool:
+        """Stay available while polls fail, that is when the metrics matter most."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the metric value."""
+        value = self.coordinator.metrics.as_dict()[self._metric]
+        if self._statistic is not None:
+            return value[self._statistic]
+        return value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, object]:
+        """Return the remaining statistics of this metric."""
+        if self._metric == "request_latency":
+            # Per-register percentiles show which blocks are slow
+            snapshot = self.coordinator.metrics_snapshot
+            return {
+                **snapshot["request_latency"],
+                "request_delay_ms": snapshot["request_delay_ms"],
+                "registers": snapshot["register_latency"],
+            }
+        if self._metric == "poll_duration":
+            metrics = self.coordinator.metrics.as_dict()
+            return {
+                **metrics["poll_duration"],
+                "polls": metrics["polls"],
+                "failed_polls": metrics["failed_polls"],
+            }
+        if self._statistic is not None:
+            return self.coordinator.metrics.as_dict()[self._metric]
+        return {}
@@ -0,0 +1,74 @@
+"""Services for the Parmair integration."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import ATTR_CONFIG_ENTRY_ID, ATTR_VALUES, DOMAIN, SERVICE_WRITE_REGISTERS
+from .coordinator import ParmairCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+WRITE_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_VALUES): vol.Schema({cv.string: vol.Coerce(float)}),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> ParmairCoordinator:
+    """Return the coordinator a service call is aimed at."""
+    coordinators: dict[str, ParmairCoordinator] = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    
+    if entry_id is None:
+        if len(coordinators) != 1:
+            raise HomeAssistantError(
+                "config_entry_id is required when more than one Parmair unit is configured"
+            )
+        return next(iter(coordinators.values()))
+    
+    if entry_id not in coordinators:
+        raise HomeAssistantError(f"No loaded Parmair unit with config entry {entry_id}")
+    return coordinators[entry_id]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register Parmair services (once for all config entries)."""
+    if hass.services.has_service(DOMAIN, SERVICE_WRITE_REGISTERS):
+        return
+
+    async def _async_write_registers(call: ServiceCall) -> None:
+        """Write several registers in as few requests as possible."""
+        coordinator = _get_coordinator(hass, call)
+        try:
+            success = await coordinator.async_write_many(call.data[ATTR_VALUES])
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        
+        if not success:
+            raise HomeAssistantError(
+                f"Failed to write one or more registers to Parmair {coordinator.host}"
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_REGISTERS,
+        _async_write_registers,
+        schema=WRITE_REGISTERS_SCHEMA,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove Parmair services once the last config entry is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+    hass.services.async_remove(DOMAIN, SERVICE_WRITE_REGISTERS)
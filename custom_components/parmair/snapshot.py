@@ -0,0 +1,76 @@
+"""Last known Parmair snapshot kept in Home Assistant storage."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_MAX_AGE, SNAPSHOT_SAVE_INTERVAL, SNAPSHOT_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotStore:
+    """Persist a unit's last polled values so setup can publish them at once.
+
+    Snapshots are saved at most every SNAPSHOT_SAVE_INTERVAL seconds while
+    polling and once more on shutdown; Home Assistant also flushes a pending
+    save when it stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for one config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._save_scheduled = False
+
+    async def async_load(self, software_version: str) -> tuple[dict[str, Any], float] | None:
+        """Return the stored values and when they were read, if still usable.
+
+        Snapshots of another firmware, or older than SNAPSHOT_MAX_AGE, are
+        ignored.
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not load the stored snapshot: %s", err)
+            return None
+        if not stored or stored.get("software_version") != software_version:
+            return None
+        read_at = stored.get("read_at", 0.0)
+        if time.time() - read_at > SNAPSHOT_MAX_AGE:
+            _LOGGER.debug("Stored snapshot is %.0fs old, ignoring it", time.time() - read_at)
+            return None
+        return stored["data"], read_at
+
+    @callback
+    def async_schedule_save(self, data_func: Callable[[], dict[str, Any]]) -> None:
+        """Save the snapshot data_func returns within SNAPSHOT_SAVE_INTERVAL.
+
+        The data is only collected when the save runs, so polls in between
+        cost nothing and the latest values are written.
+        """
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+
+        @callback
+        def _collect() -> dict[str, Any]:
+            self._save_scheduled = False
+            return data_func()
+
+        self._store.async_delay_save(_collect, SNAPSHOT_SAVE_INTERVAL)
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Save a snapshot now."""
+        self._save_scheduled = False
+        await self._store.async_save(data)
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
@@ -8,7 +8,6 @@ from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -26,6 +25,7 @@ from .const import (
     REG_TIME_PROGRAM_ENABLE,
 )
 from .coordinator import ParmairCoordinator
+from .entity import ParmairEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,7 +82,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
+class ParmairSwitch(ParmairEntity, SwitchEntity):
     """Representation of a Parmair switch."""
 
     _attr_has_entity_name = True
@@ -97,7 +97,10 @@ class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         description: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        keys = (data_key,)
+        if data_key == REG_SUMMER_MODE:
+            keys += (REG_SUMMER_MODE_TEMP_LIMIT,)
+        super().__init__(coordinator, frozenset(keys))
         self._data_key = data_key
         self._attr_name = name
         self._attr_icon = icon
@@ -113,20 +116,20 @@ class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         return value == 1 if value is not None else None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes for summer mode switch."""
+        attrs = super().extra_state_attributes
         # Only add attributes for summer mode switch
         if self._data_key == REG_SUMMER_MODE:
             temp_limit = self.coordinator.data.get(REG_SUMMER_MODE_TEMP_LIMIT)
             if temp_limit is not None:
-                return {"temperature_limit": f"{temp_limit}°C"}
-        return None
+                attrs["temperature_limit"] = f"{temp_limit}°C"
+        return attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
             await self.coordinator.async_write_register(self._data_key, 1)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to turn on %s: %s", self._data_key, ex)
             raise
@@ -135,13 +138,12 @@ class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         """Turn the switch off."""
         try:
             await self.coordinator.async_write_register(self._data_key, 0)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to turn off %s: %s", self._data_key, ex)
             raise
 
 
-class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
+class ParmairBoostSwitch(ParmairEntity, SwitchEntity):
     """Representation of a Parmair boost mode switch."""
 
     _attr_has_entity_name = True
@@ -155,7 +157,16 @@ class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         description: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset((
+                REG_CONTROL_STATE,
+                REG_BOOST_STATE,
+                REG_BOOST_TIME_SETTING,
+                REG_BOOST_SETTING,
+                REG_BOOST_TIMER,
+            )),
+        )
         self._attr_name = name
         self._attr_icon = icon
         self._attr_unique_id = f"{entry.entry_id}_boost_mode"
@@ -183,7 +194,7 @@ class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         boost_speed_value = self.coordinator.data.get(REG_BOOST_SETTING)
         boost_timer_remaining = self.coordinator.data.get(REG_BOOST_TIMER)
         
-        attrs = {}
+        attrs = super().extra_state_attributes
         if boost_time_value is not None:
             attrs["preset_duration"] = boost_time_map.get(boost_time_value, f"Unknown ({boost_time_value})")
         if boost_speed_value is not None:
@@ -197,7 +208,6 @@ class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         """Activate boost mode."""
         try:
             await self.coordinator.async_write_register(REG_CONTROL_STATE, 3)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to activate boost mode: %s", ex)
             raise
@@ -206,13 +216,12 @@ class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         """Deactivate boost mode (return to home mode)."""
         try:
             await self.coordinator.async_write_register(REG_CONTROL_STATE, 2)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to deactivate boost mode: %s", ex)
             raise
 
 
-class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
+class ParmairOverpressureSwitch(ParmairEntity, SwitchEntity):
     """Representation of a Parmair overpressure mode switch."""
 
     _attr_has_entity_name = True
@@ -226,7 +235,15 @@ class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEnt
         description: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            frozenset((
+                REG_CONTROL_STATE,
+                REG_OVERPRESSURE_STATE,
+                REG_OVERPRESSURE_TIME_SETTING,
+                REG_OVERPRESSURE_TIMER,
+            )),
+        )
         self._attr_name = name
         self._attr_icon = icon
         self._attr_unique_id = f"{entry.entry_id}_overpressure_mode"
@@ -251,7 +268,7 @@ class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEnt
         overp_time_value = self.coordinator.data.get(REG_OVERPRESSURE_TIME_SETTING)
         overp_timer_remaining = self.coordinator.data.get(REG_OVERPRESSURE_TIMER)
         
-        attrs = {}
+        attrs = super().extra_state_attributes
         if overp_time_value is not None:
             attrs["preset_duration"] = overp_time_map.get(overp_time_value, f"Unknown ({overp_time_value})")
         if overp_timer_remaining is not None and overp_timer_remaining > 0:
@@ -263,7 +280,6 @@ class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEnt
         """Activate overpressure mode."""
         try:
             await self.coordinator.async_write_register(REG_CONTROL_STATE, 4)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to activate overpressure mode: %s", ex)
             raise
@@ -272,7 +288,6 @@ class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEnt
         """Deactivate overpressure mode (return to home mode)."""
         try:
             await self.coordinator.async_write_register(REG_CONTROL_STATE, 2)
-            await self.coordinator.async_request_refresh()
         except Exception as ex:
             _LOGGER.error("Failed to deactivate overpressure mode: %s", ex)
             raise
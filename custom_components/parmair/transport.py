@@ -0,0 +1,313 @@
+"""Modbus transports used by the Parmair coordinator."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from functools import partial
+import logging
+import select
+import time
+from typing import Any
+
+from pymodbus import FramerType
+from pymodbus.client import (
+    AsyncModbusSerialClient,
+    AsyncModbusTcpClient,
+    ModbusSerialClient,
+    ModbusTcpClient,
+)
+
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_BAUDRATE,
+    CONF_IO_MODE,
+    CONF_PARITY,
+    CONF_SERIAL_PORT,
+    CONF_STOPBITS,
+    CONF_TRANSPORT,
+    DEFAULT_BAUDRATE,
+    DEFAULT_IO_MODE,
+    DEFAULT_PARITY,
+    DEFAULT_STOPBITS,
+    DEFAULT_TRANSPORT,
+    IO_MODE_ASYNCIO,
+    PACING_MIN_DELAY,
+    RTU_CHARACTER_BITS,
+    RTU_MIN_SILENT_INTERVAL,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _rtu_frame_bytes(function_code: int, count: int) -> int:
+    """Return the bytes of an RTU request and its response on the wire."""
+    if function_code == 3:
+        # Unit, function, start, count, CRC / unit, function, byte count, data, CRC
+        return 8 + 5 + 2 * count
+    if function_code == 16:
+        return 9 + 2 * count + 8
+    # Write single register: the response echoes the request
+    return 8 + 8
+
+
+def rtu_silent_interval(baudrate: int) -> float:
+    """Return the silence required between RTU frames (3.5 characters) in seconds."""
+    if baudrate > 19200:
+        return RTU_MIN_SILENT_INTERVAL
+    return 3.5 * RTU_CHARACTER_BITS / baudrate
+
+
+class ParmairTransport(ABC):
+    """Base class for the Modbus transports to one endpoint.
+
+    An endpoint is a TCP host:port or a serial port and may serve several
+    units, so every request names the unit it is for. All methods are called
+    from the event loop and are serialised by the gateway's scheduler, so
+    transports do not need their own locking.
+
+    RTU transports (serial, or RTU frames through a TCP serial bridge) know
+    the bus baud rate, from which the minimum gap between requests and the
+    time frames spend on the wire follow.
+    """
+
+    def __init__(self, host: str, port: int | None, baudrate: int | None = None) -> None:
+        """Initialize the transport."""
+        self.host = host
+        self.port = port
+        self.baudrate = baudrate
+
+    @property
+    def min_request_gap(self) -> float:
+        """Return the shortest pause allowed between requests in seconds."""
+        if self.baudrate is None:
+            return PACING_MIN_DELAY
+        return rtu_silent_interval(self.baudrate)
+
+    def wire_time(self, function_code: int, count: int) -> float:
+        """Return the time a request and its response spend on the bus in seconds."""
+        if self.baudrate is None:
+            return 0.0
+        return _rtu_frame_bytes(function_code, count) * RTU_CHARACTER_BITS / self.baudrate
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """Return True if the session is open."""
+
+    @abstractmethod
+    async def async_connect(self) -> bool:
+        """Open the session."""
+
+    @abstractmethod
+    async def async_close(self) -> None:
+        """Close the session."""
+
+    @abstractmethod
+    async def async_read_holding_registers(
+        self, address: int, count: int, unit_id: int
+    ) -> Any:
+        """Read a run of holding registers and return the pymodbus response."""
+
+    @abstractmethod
+    async def async_write_register(self, address: int, value: int, unit_id: int) -> Any:
+        """Write a single holding register and return the pymodbus response."""
+
+    @abstractmethod
+    async def async_write_registers(
+        self, address: int, values: list[int], unit_id: int
+    ) -> Any:
+        """Write a run of holding registers (FC16) and return the pymodbus response."""
+
+    @abstractmethod
+    async def async_drain(self) -> bool:
+        """Discard stale responses, returning False if the session is unusable."""
+
+
+class ExecutorTransport(ParmairTransport):
+    """Blocking pymodbus client driven through the Home Assistant executor."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: ModbusTcpClient | ModbusSerialClient,
+        host: str,
+        port: int | None,
+        baudrate: int | None = None,
+    ) -> None:
+        """Initialize the transport."""
+        super().__init__(host, port, baudrate)
+        self._hass = hass
+        self._client = client
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the session is open."""
+        return self._client.connected
+
+    async def async_connect(self) -> bool:
+        """Open the session."""
+        return await self._hass.async_add_executor_job(self._client.connect)
+
+    async def async_close(self) -> None:
+        """Close the session."""
+        if self._client.connected:
+            await self._hass.async_add_executor_job(self._client.close)
+
+    async def async_read_holding_registers(
+        self, address: int, count: int, unit_id: int
+    ) -> Any:
+        """Read a run of holding registers and return the pymodbus response."""
+        return await self._hass.async_add_executor_job(
+            partial(
+                self._client.read_holding_registers,
+                address=address,
+                count=count,
+                device_id=unit_id,
+            )
+        )
+
+    async def async_write_register(self, address: int, value: int, unit_id: int) -> Any:
+        """Write a single holding register and return the pymodbus response."""
+        return await self._hass.async_add_executor_job(
+            partial(self._client.write_register, address, value, device_id=unit_id)
+        )
+
+    async def async_write_registers(
+        self, address: int, values: list[int], unit_id: int
+    ) -> Any:
+        """Write a run of holding registers (FC16) and return the pymodbus response."""
+        return await self._hass.async_add_executor_job(
+            partial(self._client.write_registers, address, values, device_id=unit_id)
+        )
+
+    async def async_drain(self) -> bool:
+        """Discard stale responses, returning False if the session is unusable."""
+        return await self._hass.async_add_executor_job(self._drain_socket)
+
+    def _drain_socket(self) -> bool:
+        """Discard stale responses waiting in the socket buffer (runs in executor)."""
+        sock = getattr(self._client, "socket", None)
+        if sock is None:
+            return False
+
+        if hasattr(sock, "reset_input_buffer"):
+            # Serial port: let a late frame finish arriving, then drop it
+            time.sleep(0.1)
+            try:
+                sock.reset_input_buffer()
+            except OSError:
+                return False
+            return True
+
+        drained = 0
+        try:
+            # Give late responses to earlier requests a moment to arrive
+            while select.select([sock], [], [], 0.1)[0]:
+                chunk = sock.recv(1024)
+                if not chunk:
+                    # Peer closed the connection
+                    return False
+                drained += len(chunk)
+        except OSError:
+            return False
+
+        _LOGGER.debug("Drained %d stale bytes from Modbus socket", drained)
+        return True
+
+
+class AsyncTransport(ParmairTransport):
+    """Native asyncio pymodbus client running on the event loop."""
+
+    def __init__(
+        self,
+        client: AsyncModbusTcpClient | AsyncModbusSerialClient,
+        host: str,
+        port: int | None,
+        baudrate: int | None = None,
+    ) -> None:
+        """Initialize the transport."""
+        super().__init__(host, port, baudrate)
+        self._client = client
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the session is open."""
+        return self._client.connected
+
+    async def async_connect(self) -> bool:
+        """Open the session."""
+        await self._client.connect()
+        return self._client.connected
+
+    async def async_close(self) -> None:
+        """Close the session."""
+        self._client.close()
+
+    async def async_read_holding_registers(
+        self, address: int, count: int, unit_id: int
+    ) -> Any:
+        """Read a run of holding registers and return the pymodbus response."""
+        return await self._client.read_holding_registers(
+            address=address, count=count, device_id=unit_id
+        )
+
+    async def async_write_register(self, address: int, value: int, unit_id: int) -> Any:
+        """Write a single holding register and return the pymodbus response."""
+        return await self._client.write_register(address, value, device_id=unit_id)
+
+    async def async_write_registers(
+        self, address: int, values: list[int], unit_id: int
+    ) -> Any:
+        """Write a run of holding registers (FC16) and return the pymodbus response."""
+        return await self._client.write_registers(address, values, device_id=unit_id)
+
+    async def async_drain(self) -> bool:
+        """Discard stale responses, returning False if the session is unusable."""
+        # The asyncio protocol drops frames nobody is waiting for, so
+        # draining only needs to give late responses time to arrive
+        await asyncio.sleep(0.1)
+        return self._client.connected
+
+
+def endpoint_name(data: dict[str, Any]) -> str:
+    """Return the endpoint a config entry talks to: host:port or the serial port."""
+    if data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT) == TRANSPORT_SERIAL:
+        return data[CONF_SERIAL_PORT]
+    return f"{data[CONF_HOST]}:{data[CONF_PORT]}"
+
+
+def create_transport(hass: HomeAssistant, data: dict[str, Any]) -> ParmairTransport:
+    """Create the transport selected in a config entry."""
+    asyncio_mode = data.get(CONF_IO_MODE, DEFAULT_IO_MODE) == IO_MODE_ASYNCIO
+    transport = data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+
+    if transport == TRANSPORT_SERIAL:
+        baudrate = data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
+        client_class = AsyncModbusSerialClient if asyncio_mode else ModbusSerialClient
+        client = client_class(
+            data[CONF_SERIAL_PORT],
+            framer=FramerType.RTU,
+            baudrate=baudrate,
+            parity=data.get(CONF_PARITY, DEFAULT_PARITY),
+            stopbits=data.get(CONF_STOPBITS, DEFAULT_STOPBITS),
+        )
+        host, port = data[CONF_SERIAL_PORT], None
+    else:
+        if transport == TRANSPORT_RTU_OVER_TCP:
+            framer = FramerType.RTU
+            baudrate = data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
+        else:
+            framer = FramerType.SOCKET
+            baudrate = None
+        client_class = AsyncModbusTcpClient if asyncio_mode else ModbusTcpClient
+        client = client_class(host=data[CONF_HOST], port=data[CONF_PORT], framer=framer)
+        host, port = data[CONF_HOST], data[CONF_PORT]
+
+    if asyncio_mode:
+        return AsyncTransport(client, host, port, baudrate)
+    return ExecutorTransport(hass, client, host, port, baudrate)
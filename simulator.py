@@ -0,0 +1,493 @@
+"""Simulated Parmair MAC device for developing without hardware.
+
+Serves the v1.xx or v2.xx holding-register image of the integration's
+register maps over Modbus TCP, or as RTU frames over TCP like a serial
+bridge would (--rtu). Writes change device state the way the real
+unit does (mode changes update the state flags, timers and fan speed), and
+the device's failure modes can be injected: slow responses, late responses
+that surface as transaction ID mismatches, dropped replies and -1 from
+missing optional sensor modules.
+
+Usage:
+    python simulator.py [--firmware 1|2] [--host HOST] [--port PORT]
+                        [--latency SECONDS] [--jitter SECONDS]
+                        [--drop-rate RATE] [--stale-rate RATE]
+                        [--no-optional-modules] [--minute SECONDS] [--rtu]
+
+Example:
+    python simulator.py --firmware 2 --port 5020 --latency 0.05 --stale-rate 0.02
+    python test_connection.py 127.0.0.1 5020 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import importlib
+from pathlib import Path
+import random
+import sys
+import types
+
+from pymodbus import FramerType
+from pymodbus.constants import ExcCodes
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.datastore.context import ModbusBaseDeviceContext
+from pymodbus.server import ModbusTcpServer
+
+
+def _load_const():
+    """Load the integration's register maps without Home Assistant installed."""
+    package = types.ModuleType("parmair")
+    package.__path__ = [str(Path(__file__).parent / "custom_components" / "parmair")]
+    sys.modules.setdefault("parmair", package)
+    return importlib.import_module("parmair.const")
+
+
+const = _load_const()
+
+# Engineering values of a healthy unit running in home mode
+DEFAULT_VALUES = {
+    const.REG_HARDWARE_TYPE: 100,
+    const.REG_POWER: const.POWER_RUNNING,
+    const.REG_CONTROL_STATE: const.MODE_HOME,
+    const.REG_ACTUAL_SPEED: 2,
+    const.REG_SPEED_CONTROL: const.SPEED_AUTO,
+    const.REG_FRESH_AIR_TEMP: 4.5,
+    const.REG_SUPPLY_AFTER_RECOVERY_TEMP: 17.2,
+    const.REG_SUPPLY_TEMP: 19.0,
+    const.REG_EXHAUST_TEMP: 22.1,
+    const.REG_WASTE_TEMP: 8.4,
+    const.REG_EXHAUST_TEMP_SETPOINT: 21.0,
+    const.REG_SUPPLY_TEMP_SETPOINT: 18.0,
+    const.REG_HOME_SPEED: 2,
+    const.REG_AWAY_SPEED: 1,
+    const.REG_BOOST_SETTING: 4,
+    const.REG_HOME_STATE: 1,
+    const.REG_BOOST_STATE: 0,
+    const.REG_BOOST_TIMER: 0,
+    const.REG_OVERPRESSURE_STATE: 0,
+    const.REG_OVERPRESSURE_TIMER: 0,
+    const.REG_HUMIDITY: 38,
+    const.REG_HUMIDITY_24H_AVG: 36.5,
+    const.REG_CO2_EXHAUST: 620,
+    const.REG_LTO_HEAT_RECOVERY_CONTROL: 100.0,
+    const.REG_ALARM_COUNT: 0,
+    const.REG_SUM_ALARM: 0,
+    const.REG_ALARMS_STATE: 0,
+    const.REG_SUMMER_MODE: 0,
+    const.REG_TIME_PROGRAM_ENABLE: 0,
+    const.REG_HEATER_ENABLE: 1,
+    const.REG_ACKNOWLEDGE_ALARMS: 0,
+    const.REG_FILTER_STATE: 0,
+    const.REG_HEATER_TYPE: const.HEATER_TYPE_NONE,
+    const.REG_BOOST_TIME_SETTING: 3,
+    const.REG_OVERPRESSURE_TIME_SETTING: 1,
+    const.REG_SUMMER_MODE_TEMP_LIMIT: 21.0,
+    const.REG_FILTER_INTERVAL: 1,
+    const.REG_HEAT_RECOVERY_EFFICIENCY: 78.5,
+    const.REG_DEFROST_STATE: 0,
+    const.REG_SUPPLY_FAN_SPEED: 42.0,
+    const.REG_EXHAUST_FAN_SPEED: 45.0,
+    const.REG_FILTER_DAY: 1,
+    const.REG_FILTER_MONTH: 9,
+    const.REG_FILTER_YEAR: 2025,
+    const.REG_FILTER_NEXT_DAY: 1,
+    const.REG_FILTER_NEXT_MONTH: 1,
+    const.REG_FILTER_NEXT_YEAR: 2026,
+}
+
+SOFTWARE_VERSIONS = {"1": 1.83, "2": 2.10}
+
+# Sensors on add-on modules; units without them return the raw word -1 (0xFFFF)
+OPTIONAL_MODULE_KEYS = (
+    const.REG_HUMIDITY,
+    const.REG_HUMIDITY_24H_AVG,
+    const.REG_CO2_EXHAUST,
+)
+
+# Boost and overpressure time settings are indexes into these durations (minutes)
+BOOST_DURATIONS = (30, 60, 90, 120, 180)
+OVERPRESSURE_DURATIONS = (15, 30, 45, 60, 120)
+
+# Measurements that wander a little between polls
+DRIFTING_KEYS = (
+    const.REG_FRESH_AIR_TEMP,
+    const.REG_SUPPLY_TEMP,
+    const.REG_EXHAUST_TEMP,
+    const.REG_WASTE_TEMP,
+    const.REG_HUMIDITY,
+    const.REG_CO2_EXHAUST,
+)
+
+
+@dataclass
+class FaultProfile:
+    """Failure modes to inject into the simulated device."""
+
+    latency: float = 0.0  # seconds added to every request
+    jitter: float = 0.0  # random extra seconds on top of the latency
+    drop_rate: float = 0.0  # share of replies never sent
+    stale_rate: float = 0.0  # share of replies held back and sent before the next one
+    optional_modules: bool = True  # False makes optional sensors return -1
+    seed: int | None = None
+
+
+@dataclass
+class SimulatorStats:
+    """Traffic counters, reset with reset()."""
+
+    requests: int = 0
+    reads: int = 0
+    writes: int = 0
+    registers_read: int = 0
+    registers_written: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    dropped: int = 0
+    stale: int = 0
+    function_codes: dict[int, int] = field(default_factory=dict)
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.__init__()
+
+
+def _encode(definition, value: float | int) -> int:
+    """Encode an engineering value as the unsigned register word."""
+    return int(round(value / definition.scale)) & 0xFFFF
+
+
+def _decode(definition, raw: int) -> float | int:
+    """Decode a register word into its engineering value."""
+    if raw > 0x7FFF:
+        raw -= 0x10000
+    return raw * definition.scale if definition.scale != 1 else raw
+
+
+def build_register_image(firmware: str, optional_modules: bool = True) -> dict[int, int]:
+    """Return the raw holding-register image of a simulated unit.
+
+    Args:
+        firmware: "1" or "2" for the v1.xx or v2.xx register map
+        optional_modules: False to report the raw word -1 from humidity and CO2 sensors
+    """
+    compiled = const.get_compiled_registers(f"{firmware}.x")
+    values = dict(DEFAULT_VALUES, **{const.REG_SOFTWARE_VERSION: SOFTWARE_VERSIONS[firmware]})
+
+    image: dict[int, int] = {}
+    # Aliased keys share a word; the first key in the map decides its value
+    for key, definition in reversed(compiled.registers.items()):
+        if key in values:
+            image[definition.address] = _encode(definition, values[key])
+    if not optional_modules:
+        # -1 regardless of scale, as the unit reports it
+        for key in OPTIONAL_MODULE_KEYS:
+            if (definition := compiled.registers.get(key)) is not None:
+                image[definition.address] = 0xFFFF
+    return image
+
+
+class ParmairDeviceContext(ModbusBaseDeviceContext):
+    """Holding registers of one simulated unit, with device behaviour on writes."""
+
+    def __init__(self, firmware: str, faults: FaultProfile, stats: SimulatorStats) -> None:
+        """Initialize the device."""
+        self.firmware = firmware
+        self.faults = faults
+        self.stats = stats
+        self.registers = const.get_compiled_registers(f"{firmware}.x")
+        self.image = build_register_image(firmware, faults.optional_modules)
+        self._first = min(self.registers.addresses)
+        self._last = max(self.registers.addresses)
+        self._random = random.Random(faults.seed)
+        self._echo_pending = False
+        self._writing: set[int] = set()
+
+    def reset(self) -> None:
+        """Restore the initial register image."""
+        self.image = build_register_image(self.firmware, self.faults.optional_modules)
+
+    def get(self, key: str) -> float | int | None:
+        """Return the engineering value of a register key."""
+        definition = self.registers.registers.get(key)
+        if definition is None:
+            return None
+        return _decode(definition, self.image.get(definition.address, 0))
+
+    def set(self, key: str, value: float | int) -> None:
+        """Set a register key from an engineering value, if the firmware has it.
+
+        Side effects never overwrite a word the client is writing, which
+        matters where keys alias one address (v2.xx speed control and
+        actual speed).
+        """
+        definition = self.registers.registers.get(key)
+        if definition is not None and definition.address not in self._writing:
+            self.image[definition.address] = _encode(definition, value)
+
+    async def _async_delay(self) -> None:
+        """Wait like a busy controller would."""
+        delay = self.faults.latency + self._random.uniform(0, self.faults.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def async_getValues(self, func_code: int, address: int, count: int = 1):
+        """Read holding registers."""
+        if self._echo_pending:
+            # FC06 re-reads the written register to build its echo
+            self._echo_pending = False
+        else:
+            await self._async_delay()
+            self.stats.reads += 1
+            self.stats.registers_read += count
+        if address < self._first or address + count - 1 > self._last:
+            return ExcCodes.ILLEGAL_ADDRESS
+        return [self.image.get(address + offset, 0) for offset in range(count)]
+
+    async def async_setValues(self, func_code: int, address: int, values: list[int]):
+        """Write holding registers and apply their side effects."""
+        await self._async_delay()
+        self.stats.writes += 1
+        self.stats.registers_written += len(values)
+        self._echo_pending = func_code == 6
+
+        for offset, raw in enumerate(values):
+            keys = self.registers.keys_at(address + offset)
+            if not any(self.registers.registers[key].writable for key in keys):
+                return ExcCodes.ILLEGAL_ADDRESS
+        self._writing = set(range(address, address + len(values)))
+        try:
+            for offset, raw in enumerate(values):
+                self.image[address + offset] = raw
+                for key in self.registers.keys_at(address + offset):
+                    self._apply_write(key, _decode(self.registers.registers[key], raw))
+        finally:
+            self._writing = set()
+        return None
+
+    def _apply_write(self, key: str, value: float | int) -> None:
+        """Update the registers a write affects on the real unit."""
+        if key == const.REG_CONTROL_STATE:
+            self._enter_mode(int(value))
+        elif key == const.REG_BOOST_TIMER and value > 0:
+            self._enter_mode(const.MODE_BOOST, timer=int(value))
+        elif key == const.REG_OVERPRESSURE_TIMER and value > 0:
+            self._enter_mode(const.MODE_OVERPRESSURE, timer=int(value))
+        elif key == const.REG_SPEED_CONTROL:
+            if value >= const.SPEED_1:
+                self.set(const.REG_ACTUAL_SPEED, int(value) - 1)
+            elif value == const.SPEED_STOP:
+                self.set(const.REG_ACTUAL_SPEED, 0)
+            else:
+                self._enter_mode(int(self.get(const.REG_CONTROL_STATE)))
+        elif key == const.REG_POWER:
+            self.set(
+                const.REG_POWER, const.POWER_RUNNING if value else const.POWER_OFF
+            )
+        elif key == const.REG_ACKNOWLEDGE_ALARMS and value:
+            self.set(const.REG_ALARM_COUNT, 0)
+            self.set(const.REG_SUM_ALARM, 0)
+            self.set(const.REG_ALARMS_STATE, 0)
+            self.set(const.REG_ACKNOWLEDGE_ALARMS, 0)
+        elif key == const.REG_FILTER_REPLACED and value:
+            self.set(const.REG_FILTER_STATE, 0)
+
+    def _enter_mode(self, mode: int, timer: int | None = None) -> None:
+        """Switch operating mode, updating state flags, timers and fan speed."""
+        boost = mode in (const.MODE_BOOST, const.MODE_BOOST_TIMER)
+        overpressure = mode in (const.MODE_OVERPRESSURE, const.MODE_OVERPRESSURE_TIMER)
+        home = mode in (const.MODE_HOME, const.MODE_HOME_TIMER)
+
+        if self.firmware == "2":
+            # v2.xx exposes the mode and the state flags through one register
+            self.set(const.REG_CONTROL_STATE, mode)
+        else:
+            self.set(const.REG_CONTROL_STATE, mode)
+            self.set(const.REG_HOME_STATE, int(home))
+            self.set(const.REG_BOOST_STATE, int(boost))
+            self.set(const.REG_OVERPRESSURE_STATE, int(overpressure))
+
+        if boost:
+            index = int(self.get(const.REG_BOOST_TIME_SETTING) or 0)
+            self.set(const.REG_BOOST_TIMER, timer or BOOST_DURATIONS[min(index, 4)])
+        else:
+            self.set(const.REG_BOOST_TIMER, 0)
+        if overpressure:
+            index = int(self.get(const.REG_OVERPRESSURE_TIME_SETTING) or 0)
+            self.set(const.REG_OVERPRESSURE_TIMER, timer or OVERPRESSURE_DURATIONS[min(index, 4)])
+        else:
+            self.set(const.REG_OVERPRESSURE_TIMER, 0)
+
+        speeds = {
+            const.MODE_STOP: 0,
+            const.MODE_AWAY: self.get(const.REG_AWAY_SPEED),
+            const.MODE_AWAY_TIMER: self.get(const.REG_AWAY_SPEED),
+            const.MODE_HOME: self.get(const.REG_HOME_SPEED),
+            const.MODE_HOME_TIMER: self.get(const.REG_HOME_SPEED),
+            const.MODE_BOOST: self.get(const.REG_BOOST_SETTING),
+            const.MODE_BOOST_TIMER: self.get(const.REG_BOOST_SETTING),
+            const.MODE_OVERPRESSURE: self.get(const.REG_BOOST_SETTING),
+            const.MODE_OVERPRESSURE_TIMER: self.get(const.REG_BOOST_SETTING),
+        }
+        if mode in speeds and self.get(const.REG_SPEED_CONTROL) in (const.SPEED_AUTO, None):
+            self.set(const.REG_ACTUAL_SPEED, int(speeds[mode] or 0))
+
+    def tick(self) -> None:
+        """Advance one simulated minute: count down timers and drift sensors."""
+        for timer_key in (const.REG_BOOST_TIMER, const.REG_OVERPRESSURE_TIMER):
+            remaining = self.get(timer_key) or 0
+            if remaining > 1:
+                self.set(timer_key, remaining - 1)
+            elif remaining == 1:
+                self._enter_mode(const.MODE_HOME)
+
+        for key in DRIFTING_KEYS:
+            value = self.get(key)
+            if value is None or value == -1:
+                continue
+            definition = self.registers.registers[key]
+            step = definition.scale * self._random.choice((-1, 0, 0, 1))
+            self.set(key, value + step)
+
+
+class FaultInjector:
+    """Drop or delay whole response frames on their way out."""
+
+    def __init__(
+        self, faults: FaultProfile, stats: SimulatorStats, rtu: bool = False
+    ) -> None:
+        """Initialize the injector."""
+        # Offset of the function code: after the MBAP header, or the unit ID
+        self._function_offset = 1 if rtu else 7
+        self.faults = faults
+        self.stats = stats
+        self._random = random.Random(faults.seed)
+        self._late = b""
+
+    def __call__(self, sending: bool, data: bytes) -> bytes:
+        """Pass a raw frame through, possibly dropping or holding back replies."""
+        if not sending:
+            self.stats.requests += 1
+            self.stats.bytes_received += len(data)
+            if len(data) > self._function_offset:
+                function_code = data[self._function_offset]
+                self.stats.function_codes[function_code] = (
+                    self.stats.function_codes.get(function_code, 0) + 1
+                )
+            return data
+
+        late, self._late = self._late, b""
+        roll = self._random.random()
+        if roll < self.faults.drop_rate:
+            self.stats.dropped += 1
+            data = b""
+        elif roll < self.faults.drop_rate + self.faults.stale_rate:
+            # Deliver this reply in front of the next one, so the client
+            # times out now and reads a stale transaction ID next time
+            self.stats.stale += 1
+            self._late = data
+            data = b""
+        out = late + data
+        self.stats.bytes_sent += len(out)
+        return out
+
+
+class ParmairSimulator:
+    """A running simulated unit."""
+
+    def __init__(
+        self,
+        firmware: str = "1",
+        host: str = "127.0.0.1",
+        port: int = 5020,
+        faults: FaultProfile | None = None,
+        minute: float = 60.0,
+        rtu: bool = False,
+    ) -> None:
+        """Initialize the simulator."""
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultProfile()
+        self.minute = minute
+        self.stats = SimulatorStats()
+        self.device = ParmairDeviceContext(firmware, self.faults, self.stats)
+        self._server = ModbusTcpServer(
+            ModbusServerContext(devices=self.device, single=True),
+            address=(host, port),
+            framer=FramerType.RTU if rtu else FramerType.SOCKET,
+            trace_packet=FaultInjector(self.faults, self.stats, rtu),
+        )
+        self._clock: asyncio.Task | None = None
+
+    async def async_start(self) -> None:
+        """Start serving in the background."""
+        await self._server.serve_forever(background=True)
+        self._clock = asyncio.create_task(self._async_run_clock())
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._clock is not None:
+            self._clock.cancel()
+        await self._server.shutdown()
+
+    async def _async_run_clock(self) -> None:
+        """Advance the device clock."""
+        while True:
+            await asyncio.sleep(self.minute)
+            self.device.tick()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run a simulator until interrupted."""
+    simulator = ParmairSimulator(
+        firmware=args.firmware,
+        host=args.host,
+        port=args.port,
+        faults=FaultProfile(
+            latency=args.latency,
+            jitter=args.jitter,
+            drop_rate=args.drop_rate,
+            stale_rate=args.stale_rate,
+            optional_modules=not args.no_optional_modules,
+            seed=args.seed,
+        ),
+        minute=args.minute,
+        rtu=args.rtu,
+    )
+    await simulator.async_start()
+    print(
+        f"Simulating Parmair MAC firmware {SOFTWARE_VERSIONS[args.firmware]:.2f} "
+        f"on {args.host}:{args.port} (Ctrl+C to stop)"
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.async_stop()
+        print(f"\n{simulator.stats}")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Simulated Parmair MAC Modbus device")
+    parser.add_argument("--firmware", choices=("1", "2"), default="1")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency in seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of replies never sent")
+    parser.add_argument("--stale-rate", type=float, default=0.0, help="share of replies delivered late")
+    parser.add_argument("--no-optional-modules", action="store_true", help="humidity/CO2 read -1")
+    parser.add_argument("--minute", type=float, default=60.0, help="seconds per simulated minute")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--rtu", action="store_true", help="RTU framing, like a serial bridge")
+
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -11,14 +11,39 @@ Example:
     python test_connection.py 192.168.1.100 502 1
 """
 
+import importlib
+from pathlib import Path
 import sys
+import types
+
 from pymodbus.client import ModbusTcpClient
 
-# Register addresses from const.py (subtract 1 from register ID)
-REGISTER_POWER = 207  # Register 208
-REGISTER_CONTROL_STATE = 184  # Register 185
-REGISTER_EXHAUST_TEMP = 23  # Register 24
-REGISTER_SUPPLY_TEMP = 22  # Register 23
+
+def _load_const():
+    """Load the integration's register maps without Home Assistant installed."""
+    package = types.ModuleType("parmair")
+    package.__path__ = [str(Path(__file__).parent / "custom_components" / "parmair")]
+    sys.modules.setdefault("parmair", package)
+    return importlib.import_module("parmair.const")
+
+
+const = _load_const()
+
+
+def detect_registers(client, slave_id):
+    """Return the register map of the firmware whose version register answers."""
+    for software_version, (low, high) in (
+        (const.SOFTWARE_VERSION_2, (200, 299)),
+        (const.SOFTWARE_VERSION_1, (100, 199)),
+    ):
+        registers = const.get_registers_for_version(software_version)
+        address = registers[const.REG_SOFTWARE_VERSION].address
+        result = client.read_holding_registers(address, count=1, device_id=slave_id)
+        if not result.isError() and low <= result.registers[0] <= high:
+            print(f"✅ Firmware {result.registers[0] / 100:.2f} (Reg {address - 1000})")
+            return registers
+    print("⚠️  Could not detect firmware version, assuming 1.xx register map")
+    return const.get_registers_for_version(const.SOFTWARE_VERSION_1)
 
 def test_connection(host, port=502, slave_id=1):
     """Test connection to Parmair device."""
@@ -35,40 +60,46 @@ def test_connection(host, port=502, slave_id=1):
         
         print("✅ Connected successfully")
         
-        # Test reading power status
         print("\nReading registers...")
-        result = client.read_holding_registers(REGISTER_POWER, 1, slave=slave_id)
+        registers = detect_registers(client, slave_id)
+        power = registers[const.REG_POWER]
+        control_state = registers[const.REG_CONTROL_STATE]
+        exhaust_temp = registers[const.REG_EXHAUST_TEMP]
+        supply_temp = registers[const.REG_SUPPLY_TEMP]
+        
+        # Test reading power status
+        result = client.read_holding_registers(power.address, count=1, device_id=slave_id)
         
         if result.isError():
-            print(f"❌ Error reading register {REGISTER_POWER}: {result}")
+            print(f"❌ Error reading register {power.register_id}: {result}")
             print("   Check slave ID and Modbus configuration")
             return False
         
         power_state = result.registers[0]
         power_states = {0: "Off", 1: "Shutting down", 2: "Starting", 3: "Running"}
-        print(f"✅ Power State (Reg 208): {power_state} ({power_states.get(power_state, 'Unknown')})")
+        print(f"✅ Power State (Reg {power.register_id}): {power_state} ({power_states.get(power_state, 'Unknown')})")
         
         # Read control state
-        result = client.read_holding_registers(REGISTER_CONTROL_STATE, 1, slave=slave_id)
+        result = client.read_holding_registers(control_state.address, count=1, device_id=slave_id)
         if not result.isError():
-            control_state = result.registers[0]
+            state = result.registers[0]
             control_states = {
                 0: "STOP", 1: "AWAY", 2: "HOME", 3: "BOOST",
                 4: "OVERPRESSURE", 9: "MANUAL"
             }
-            print(f"✅ Control State (Reg 185): {control_state} ({control_states.get(control_state, f'Mode {control_state}')})")
+            print(f"✅ Control State (Reg {control_state.register_id}): {state} ({control_states.get(state, f'Mode {state}')})")
         
         # Read exhaust temperature
-        result = client.read_holding_registers(REGISTER_EXHAUST_TEMP, 1, slave=slave_id)
+        result = client.read_holding_registers(exhaust_temp.address, count=1, device_id=slave_id)
         if not result.isError():
-            temp = result.registers[0] / 10.0
-            print(f"✅ Exhaust Temperature (Reg 24): {temp}°C")
+            temp = result.registers[0] * exhaust_temp.scale
+            print(f"✅ Exhaust Temperature (Reg {exhaust_temp.register_id}): {temp}°C")
         
         # Read supply temperature  
-        result = client.read_holding_registers(REGISTER_SUPPLY_TEMP, 1, slave=slave_id)
+        result = client.read_holding_registers(supply_temp.address, count=1, device_id=slave_id)
         if not result.isError():
-            temp = result.registers[0] / 10.0
-            print(f"✅ Supply Temperature (Reg 23): {temp}°C")
+            temp = result.registers[0] * supply_temp.scale
+            print(f"✅ Supply Temperature (Reg {supply_temp.register_id}): {temp}°C")
         
         print("\n" + "="*50)
         print("✅ Connection test successful!")